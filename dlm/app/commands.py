@@ -47,10 +47,18 @@ class StartDownload(Command):
 class PauseDownload(Command):
     id: str
 
+@dataclass
+class PauseDownloads(Command):
+    ids: List[str]
+
 @dataclass
 class ResumeDownload(Command):
     id: str
 
+@dataclass
+class ResumeDownloads(Command):
+    ids: List[str]
+
 @dataclass
 class RemoveDownload(Command):
     id: str
@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import Optional, List, Dict
 from concurrent.futures import ThreadPoolExecutor, Future
+import os
 import threading
 import time
 import json
@@ -14,6 +15,9 @@ from dlm.core.interfaces import NetworkAdapter
 
 import hashlib
 
+# 20-cell vocals progress bars, one per 5% step: rendering is an index, not two string builds
+_VOCALS_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
 
 def sanitize_folder_name(name: str) -> str:
     """Sanitize a string to be safe as a folder name."""
@@ -108,6 +112,9 @@ def resolve_target_path(output_template: str, rename_template: str, metadata: di
 from dlm.core.config import SecureConfigRepository
 
 class DownloadService:
+    # Sources downloaded by their own worker (no byte segments); built once, not per check
+    WORKER_SOURCES = frozenset(('youtube', 'tiktok', 'spotify', 'torrent'))
+
     def __init__(self, repository: DownloadRepository, network: NetworkAdapter, download_dir: Path, max_workers: int = 4, media_service=None, config_repo: SecureConfigRepository = None):
         self.repository = repository
         self.network = network
@@ -124,13 +131,19 @@ class DownloadService:
         self._cancel_events: Dict[str, threading.Event] = {}
         self._last_tiktok_profile_download: Dict[str, float] = {} # For rate-limit guard
         self._batch_queue: deque = deque() # Real ordered queue for batch tasks
+        self._batch_ids: set = set() # Same IDs as _batch_queue, for O(1) membership checks
         self._discovery_tasks: set = set() # track IDs in discovery phase
+        self._renewing: set = set() # IDs with a renewal browser already open
         self._lock = threading.RLock()
         self.torrent_network = None # Injected by bootstrap
         
         # Vocals / Post-Processing Queue
         self.vocals_queue = [] # List of {"id": str, "path": Path, "gpu": bool, "status": "queued"|"processing"|"done"|"failed", "progress": 0, "error": None}
+        self._vocals_pending: deque = deque() # Tasks still 'queued', in order: the worker pops instead of scanning
+        self.vocals_active = 0 # Queued + processing tasks, kept in step with status changes
         self.vocals_lock = threading.Lock()
+        self.vocals_changed = threading.Event() # Set on every queue/task change; monitors wait on it
+        self._vocals_wake = threading.Event() # Set by queue_vocals; the idle worker sleeps on it
         self.shutdown_event = threading.Event()
         self.vocals_worker_thread = threading.Thread(target=self._vocals_loop, daemon=True)
         self.vocals_worker_thread.start()
@@ -301,10 +314,11 @@ class DownloadService:
                 # 2. Standard Batch Queue pop
                 if self._batch_queue:
                     download_id = self._batch_queue.popleft()
+                    self._batch_ids.discard(download_id)
                 
                 # 3. If Batch Queue empty, check for WAITING tasks in DB
                 if not download_id:
-                    waiting_tasks = [d.id for d in self.repository.get_all() if d.state == DownloadState.WAITING]
+                    waiting_tasks = self.repository.get_ids_by_state(DownloadState.WAITING)
                     if waiting_tasks:
                         download_id = waiting_tasks[0]
                 
@@ -736,6 +750,7 @@ class DownloadService:
         try:
             # Phase 20: Optimization for LAN URLs
             is_lan = any(prefix in url for prefix in ["192.168.", "10.", "172."])
+            ranges = None # Range support, when the size probe already answered it
             if is_lan:
                 dl.total_size = total_size
                 dl.resumable = True # LAN transfers are assumed resumable (dlm-to-dlm)
@@ -744,7 +759,7 @@ class DownloadService:
                  dl.resumable = True
             else:
                  try:
-                     dl.total_size = self.network.get_content_length(url, referer=dl.referer)
+                     dl.total_size, ranges = self.network.probe(url, referer=dl.referer)
                  except: 
                      dl.total_size = 0
             
@@ -770,7 +785,8 @@ class DownloadService:
             dl.output_path = str(final_folder) if (output_template or kwargs.get('output_template')) else None
 
             if not dl.resumable:
-                dl.resumable = self.network.supports_ranges(url, referer=dl.referer)
+                # The size probe may already have seen a 206; only ask the server when it didn't
+                dl.resumable = ranges if ranges is not None else self.network.supports_ranges(url, referer=dl.referer)
             
 
                 
@@ -823,7 +839,7 @@ class DownloadService:
             if 'captured_cookies_json' in capture:
                 dl.captured_cookies = json.loads(capture['captured_cookies_json'])
             
-            if dl.total_size > 0 and dl.source not in ['youtube', 'tiktok', 'spotify', 'torrent']:
+            if dl.total_size > 0 and dl.source not in self.WORKER_SOURCES:
                 dl.resumable = True
                 self._initialize_segments(dl)
             else:
@@ -836,7 +852,7 @@ class DownloadService:
         else:
             # Already promoted, just ensure fields are synced if discovery finished recently
             if (not dl.total_size or dl.total_size == 0):
-                if capture.get('size') and dl.source not in ['youtube', 'tiktok', 'spotify', 'torrent']:
+                if capture.get('size') and dl.source not in self.WORKER_SOURCES:
                     dl.total_size = capture['size']
                     dl.resumable = True
                     self._initialize_segments(dl)
@@ -867,8 +883,8 @@ class DownloadService:
                 if download_id in self._active_downloads:
                     is_active = self._active_downloads[download_id].state == DownloadState.DOWNLOADING
                 
-                if download_id not in self._batch_queue and not is_active:
-                    self._batch_queue.append(download_id)
+                if not is_active:
+                    self._enqueue_batch(download_id)
         
         if dl.state in [DownloadState.COMPLETED, DownloadState.FAILED]: return
         if dl.state == DownloadState.DOWNLOADING: return
@@ -895,24 +911,25 @@ class DownloadService:
             def do_discovery():
                 try:
                     # STRICT 10s timeout for discovery
-                    new_size = self.network.get_content_length(dl.url, referer=dl.referer, headers=dl.captured_headers, cookies=dl.captured_cookies, user_agent=dl.user_agent, timeout=10)
+                    new_size, ranges = self.network.probe(dl.url, referer=dl.referer, headers=dl.captured_headers, cookies=dl.captured_cookies, user_agent=dl.user_agent, timeout=10)
                     if not new_size or new_size == 0:
                         # Try stream probe if HEAD didn't work and we haven't probed yet
                         if not getattr(dl, 'probed_via_stream', False):
                             dl.probed_via_stream = True
-                            new_size = self.network.get_content_length(dl.url, referer=dl.referer, headers=dl.captured_headers, cookies=dl.captured_cookies, user_agent=dl.user_agent, timeout=10)
+                            new_size, ranges = self.network.probe(dl.url, referer=dl.referer, headers=dl.captured_headers, cookies=dl.captured_cookies, user_agent=dl.user_agent, timeout=10)
 
                     if new_size and new_size > 0:
                         dl.total_size = new_size
-                        dl.resumable = self.network.supports_ranges(dl.url, referer=dl.referer, headers=dl.captured_headers, cookies=dl.captured_cookies, user_agent=dl.user_agent)
+                        if ranges is None:
+                            ranges = self.network.supports_ranges(dl.url, referer=dl.referer, headers=dl.captured_headers, cookies=dl.captured_cookies, user_agent=dl.user_agent)
+                        dl.resumable = ranges
                         self._initialize_segments(dl)
                         dl.state = DownloadState.QUEUED
                         self.repository.save(dl)
                         
                         with self._lock: self._discovery_tasks.discard(download_id)
                         # Re-inject into batch queue to ensure it follows concurrency rules
-                        if download_id not in self._batch_queue:
-                            self._batch_queue.append(download_id)
+                        self._enqueue_batch(download_id)
                         self._process_queue()
                     else:
                         with self._lock: self._discovery_tasks.discard(download_id)
@@ -927,7 +944,7 @@ class DownloadService:
 
         # [ARCH-FIX] Ensure segments are initialized for known-size downloads
         # This prevents them from falling back to _stream_worker which might have progress tracking issues for known sizes.
-        if dl.total_size > 0 and not dl.segments and dl.source not in ['youtube', 'tiktok', 'spotify', 'torrent']:
+        if dl.total_size > 0 and not dl.segments and dl.source not in self.WORKER_SOURCES:
              self._initialize_segments(dl)
              self.repository.save(dl)
 
@@ -1018,9 +1035,20 @@ class DownloadService:
             self._save_metadata(dl)
 
             # Re-inject into batch queue if not there
-            if download_id not in self._batch_queue:
+            self._enqueue_batch(download_id)
+
+    def _enqueue_batch(self, download_id: str):
+        """Append to the batch queue unless the ID is already waiting there."""
+        with self._lock: # Keep the deque and its ID set in step
+            if download_id not in self._batch_ids:
+                self._batch_ids.add(download_id)
                 self._batch_queue.append(download_id)
 
+    def get_batch_ids(self) -> frozenset:
+        """Snapshot of the IDs waiting in the batch queue, safe to read from any thread."""
+        with self._lock:
+            return frozenset(self._batch_ids)
+
     def resume_download(self, download_id: str):
         """Resume a paused or failed download."""
         dl = self.get_download(download_id)
@@ -1030,11 +1058,30 @@ class DownloadService:
         if dl.state == DownloadState.DOWNLOADING:
             return
 
-        if download_id not in self._batch_queue:
-            self._batch_queue.append(download_id)
+        self._enqueue_batch(download_id)
         
         self._process_queue()
 
+    def resume_downloads(self, download_ids: List[str]) -> int:
+        """Resume several downloads; returns how many were queued without error."""
+        # Queue everything first, then run the engine once for the whole selection
+        # instead of one queue pass (and its DB lookups) per download.
+        count = 0
+        for download_id in download_ids:
+            try:
+                dl = self.get_download(download_id)
+            except Exception:
+                continue
+            if not dl:
+                continue # Download not found
+            if dl.state != DownloadState.DOWNLOADING:
+                self._enqueue_batch(download_id)
+            count += 1
+        
+        if count:
+            self._process_queue()
+        return count
+
     def pause_download(self, download_id: str):
         """Pause a running download."""
         # 1. Signal cancellation FIRST (no lock needed for set())
@@ -1069,6 +1116,25 @@ class DownloadService:
                  # Metadata save might block slightly, but acceptable compared to deadlocks
                  self._save_metadata(dl)
 
+    def pause_downloads(self, download_ids: List[str]) -> int:
+        """Pause several downloads; returns how many were paused without error."""
+        # Signal every worker up front so all transfers stop together,
+        # instead of the last one running until the earlier ones are persisted.
+        with self._lock:
+            for download_id in download_ids:
+                event = self._cancel_events.get(download_id)
+                if event:
+                    event.set()
+        
+        count = 0
+        for download_id in download_ids:
+            try:
+                self.pause_download(download_id)
+                count += 1
+            except Exception:
+                pass
+        return count
+
     def _async_cleanup(self, folder: Path, retries: int = 10):
         """Helper to delete folder with retries (background thread)."""
         import shutil
@@ -1214,20 +1280,20 @@ class DownloadService:
                     seg.downloaded_bytes = 0
                     seg.last_checkpoint = 0
                 
-                # Integrity check for completed segments
-                if seg.is_complete and part_file.exists():
+                # Integrity check for completed segments (only read the file when a stored hash can be compared)
+                if seg.is_complete and (seg.start_hash or seg.end_hash) and p_file.exists():
                     try:
-                        current_start, current_end = self._compute_segment_hashes(part_file)
+                        current_start, current_end = self._compute_segment_hashes(p_file)
                         
                         if seg.start_hash and current_start != seg.start_hash:
                             dl.resume_state = ResumeState.UNSTABLE
-                            with open(part_file, "wb") as f:
+                            with open(p_file, "wb") as f:
                                 pass
                             seg.downloaded_bytes = 0
                             seg.last_checkpoint = 0
                         elif seg.end_hash and current_end != seg.end_hash:
                             dl.resume_state = ResumeState.UNSTABLE
-                            with open(part_file, "wb") as f:
+                            with open(p_file, "wb") as f:
                                 pass
                             seg.downloaded_bytes = 0
                             seg.last_checkpoint = 0
@@ -1553,20 +1619,18 @@ class DownloadService:
 
     def _vocals_loop(self):
         """Background worker for monitoring and processing vocals queue."""
-        import time
         while not self.shutdown_event.is_set():
             task_to_process = None
             
             with self.vocals_lock:
-                # Find first queued task
-                for task in self.vocals_queue:
-                    if task['status'] == 'queued':
-                         task_to_process = task
-                         task['status'] = 'processing'
-                         task['progress'] = 0
-                         break
+                # Next queued task, O(1) however many finished tasks the list holds
+                if self._vocals_pending:
+                    task_to_process = self._vocals_pending.popleft()
+                    task_to_process['status'] = 'processing'
+                    task_to_process['progress'] = 0
             
             if task_to_process:
+                self.vocals_changed.set()
                 try:
                     self.separate_vocals(
                          task_to_process['path'], 
@@ -1577,29 +1641,41 @@ class DownloadService:
                     with self.vocals_lock:
                         task_to_process['status'] = 'done'
                         task_to_process['progress'] = 100
+                        self.vocals_active -= 1
                 except Exception as e:
                     # print(f"Vocals Task Failed: {e}")
                     with self.vocals_lock:
                          task_to_process['status'] = 'failed'
                          task_to_process['error'] = str(e)
+                         self.vocals_active -= 1
+                self.vocals_changed.set()
             else:
-                time.sleep(1.0)
+                # Idle until a task is queued instead of polling every second. Clearing after
+                # the wake is safe: the pending deque is re-checked before waiting again.
+                # The timeout only bounds how long a shutdown goes unnoticed.
+                self._vocals_wake.wait(5.0)
+                self._vocals_wake.clear()
 
     def queue_vocals(self, path: Path, use_gpu: bool = False, keep_all: bool = False) -> str:
         """Add a file to the vocals processing queue."""
         import uuid
         task_id = str(uuid.uuid4())[:8]
+        task = {
+            "id": task_id,
+            "path": path,
+            "gpu": use_gpu,
+            "keep_all": keep_all,
+            "status": "queued",
+            "progress": 0,
+            "error": None,
+            "filename": path.name
+        }
         with self.vocals_lock:
-            self.vocals_queue.append({
-                "id": task_id,
-                "path": path,
-                "gpu": use_gpu,
-                "keep_all": keep_all,
-                "status": "queued",
-                "progress": 0,
-                "error": None,
-                "filename": path.name
-            })
+            self.vocals_queue.append(task)
+            self._vocals_pending.append(task)
+            self.vocals_active += 1
+        self._vocals_wake.set()
+        self.vocals_changed.set()
         return task_id
 
     def get_vocals_queue(self):
@@ -1632,6 +1708,7 @@ class DownloadService:
              print("[vocals] processing")
         else:
              queue_task_ref['status'] = 'extracting audio...'
+             self.vocals_changed.set()
         
         try:
             # 2. Extract audio if video
@@ -1904,10 +1981,9 @@ class DownloadService:
                                     self.repository.save(dl)
                             elif task_ref:
                                 task_ref['progress'] = percent
-                                # No DB save needed for queue task
+                                self.vocals_changed.set() # No DB save needed for queue task
                             else:
-                                filled = percent // 5
-                                bar = "█" * filled + "░" * (20 - filled)
+                                bar = _VOCALS_BARS[min(percent // 5, 20)]
                                 sys.stdout.write(f"\r[separate] vocals [{bar}] {percent}%")
                                 sys.stdout.flush()
                             last_percent = percent
@@ -2559,9 +2635,8 @@ class DownloadService:
         last_scaling_time = time.time()
         last_speed = 0.0
         
-        while not cancel_event.is_set():
-            time.sleep(1)
-            
+        # wait() returns as soon as the task is paused/deleted instead of finishing a full sleep
+        while not cancel_event.wait(1):
             # Stop if deleted
             if getattr(dl, "deleted", False):
                 self._wait_and_cleanup(dl)
@@ -2616,7 +2691,7 @@ class DownloadService:
                     return
 
                 # Race Guard: Check if worker thread already picked it up
-                if dl.current_stage == "finalizing" or dl.source in ['youtube', 'tiktok', 'spotify', 'torrent']:
+                if dl.current_stage == "finalizing" or dl.source in self.WORKER_SOURCES:
                      return
 
                 dl.current_stage = "finalizing"
@@ -2698,7 +2773,8 @@ class DownloadService:
                 # yt-dlp might have finished but we missed the filename?
                 # Let's check for any file in workspace that might be it.
                 if folder.exists():
-                    files = [f for f in folder.iterdir() if f.is_file() and f.name != "dlm.meta"]
+                    with os.scandir(folder) as it:
+                        files = [Path(e.path) for e in it if e.is_file() and e.name != "dlm.meta"]
                     if files:
                         workspace_file = files[0]
                         dl.target_filename = workspace_file.name
@@ -3346,25 +3422,42 @@ class DownloadService:
         dl = self.get_download(download_id)
         if not dl: return
         
-        # 1. Pause the download if it's currently running
-        self.pause_download(download_id)
+        # Every segment of a multi-connection download can hit the 403 at once:
+        # open one browser per download, not one thread + browser per failing segment
+        with self._lock:
+            if download_id in self._renewing:
+                return
+            self._renewing.add(download_id)
         
-        # 2. Get the source URL
-        source_url = dl.source_url or dl.referer or dl.url
+        try:
+            # 1. Pause the download if it's currently running
+            self.pause_download(download_id)
         
-        # 3. Open Chromium (Visible) at source_url with overlay
-        from dlm.app.commands import BrowserCommand
-        # We assume the CommandBus is accessible or we use a more direct method.
-        # In this architecture, service doesn't have the bus, but we can resolve it from bootstrap if needed.
-        # However, we can just run the browser_command function directly in a thread.
-        from dlm.app.browser_service import browser_command
-        import asyncio
-
-        def run_browser():
-            asyncio.run(browser_command(target_url=source_url))
+            # 2. Get the source URL
+            source_url = dl.source_url or dl.referer or dl.url
         
-        thread = threading.Thread(target=run_browser, daemon=True)
-        thread.start()
+            # 3. Open Chromium (Visible) at source_url with overlay
+            from dlm.app.commands import BrowserCommand
+            # We assume the CommandBus is accessible or we use a more direct method.
+            # In this architecture, service doesn't have the bus, but we can resolve it from bootstrap if needed.
+            # However, we can just run the browser_command function directly in a thread.
+            from dlm.app.browser_service import browser_command
+            import asyncio
+
+            def run_browser():
+                try:
+                    asyncio.run(browser_command(target_url=source_url))
+                finally:
+                    with self._lock:
+                        self._renewing.discard(download_id)
+        
+            thread = threading.Thread(target=run_browser, daemon=True)
+            thread.start()
+        except BaseException:
+            # Nothing will run the thread's cleanup: release the slot so a later 403 can retry
+            with self._lock:
+                self._renewing.discard(download_id)
+            raise
         
         print(f"[RENEW] Browser opened for {dl.target_filename} at {source_url}")
 
@@ -7,9 +7,11 @@ from dlm.app.media_service import MediaService
 from dlm.core.workspace import WorkspaceManager
 import json
 import os
+import threading
+import time
 from typing import Optional, Dict, Any
 
-from dlm.app.commands import CommandBus, AddDownload, ListDownloads, StartDownload, PauseDownload, ResumeDownload, RemoveDownload, RetryDownload, SplitDownload, ImportDownload, VocalsCommand, BrowserCommand, PromoteBrowserDownload, RecaptureDownload, CreateFolder, MoveTask, DeleteFolder, RemoveBrowserDownload, RegisterExternalTask, UpdateExternalTask
+from dlm.app.commands import CommandBus, AddDownload, ListDownloads, StartDownload, PauseDownload, PauseDownloads, ResumeDownload, ResumeDownloads, RemoveDownload, RetryDownload, SplitDownload, ImportDownload, VocalsCommand, BrowserCommand, PromoteBrowserDownload, RecaptureDownload, CreateFolder, MoveTask, DeleteFolder, RemoveBrowserDownload, RegisterExternalTask, UpdateExternalTask
 from dlm.core.entities import DownloadState, Download
 
 def get_project_root() -> Path:
@@ -336,8 +338,44 @@ def create_container() -> dict:
             depth += 1
         return None
 
+    # Completed external tasks stay listed ~1s so monitors can render "Completed".
+    # {task_id: deadline}: one shared timer deletes them when due (no sleeping thread per
+    # task), and list/update also purge so an expired row is never listed.
+    finished_external: Dict[str, float] = {}
+    finished_lock = threading.Lock() # Updates and listings arrive from different threads
+    sweep_timer = None # Pending threading.Timer, if any
+
+    def _purge_finished_external():
+        now = time.monotonic()
+        with finished_lock:
+            expired = [tid for tid, deadline in list(finished_external.items()) if deadline <= now]
+            for tid in expired:
+                finished_external.pop(tid, None)
+        # Popped under the lock: each row is deleted by exactly one caller
+        if not expired: return
+        for tid in expired:
+            repo.delete(tid)
+        _rebuild_index_mapping(repo)
+
+    def _schedule_sweep():
+        # Caller holds finished_lock
+        nonlocal sweep_timer
+        if sweep_timer is None and finished_external:
+            delay = max(0.0, min(finished_external.values()) - time.monotonic())
+            sweep_timer = threading.Timer(delay, _sweep_finished_external)
+            sweep_timer.daemon = True
+            sweep_timer.start()
+
+    def _sweep_finished_external():
+        nonlocal sweep_timer
+        _purge_finished_external()
+        with finished_lock:
+            sweep_timer = None
+            _schedule_sweep() # Entries finished after this one was due
+
     def handle_list_downloads(cmd: ListDownloads):
         global _index_to_uuid, _browser_index_to_id
+        _purge_finished_external()
         # Rebuild index mapping to ensure correctness before listing
         _rebuild_index_mapping(repo, brw=cmd.brw, folder_id=cmd.folder_id, include_workspace=cmd.include_workspace)
         
@@ -467,6 +505,8 @@ def create_container() -> dict:
             _index_to_uuid[idx] = f"folder:{f['id']}"
             idx += 1
             
+        # Snapshot the batch queue once (under the service lock): O(1) membership per row
+        batch_ids = service.get_batch_ids()
         for d in downloads:
             results.append({
                 "index": idx,
@@ -490,7 +530,7 @@ def create_container() -> dict:
                 "speed": getattr(d, 'speed_bps', 0.0),
                 "error": d.error_message,
                 "segments": [{"start": s.start_byte, "end": s.end_byte, "downloaded": s.downloaded_bytes} for s in d.segments] if d.segments else [],
-                "in_scope": any(d.id == qid for qid in service._batch_queue)
+                "in_scope": d.id in batch_ids
             })
             _index_to_uuid[idx] = d.id
             idx += 1
@@ -509,9 +549,15 @@ def create_container() -> dict:
     def handle_pause_download(cmd: PauseDownload):
         service.pause_download(cmd.id)
 
+    def handle_pause_downloads(cmd: PauseDownloads):
+        return service.pause_downloads(cmd.ids)
+
     def handle_resume_download(cmd: ResumeDownload):
         service.resume_download(cmd.id)
 
+    def handle_resume_downloads(cmd: ResumeDownloads):
+        return service.resume_downloads(cmd.ids)
+
     def handle_remove_download(cmd: RemoveDownload):
         download = repo.get(cmd.id)
         f_id = download.folder_id if download else None
@@ -618,6 +664,7 @@ def create_container() -> dict:
         return d.id
 
     def handle_update_external_task(cmd: UpdateExternalTask):
+        _purge_finished_external()
         # Check repository first
         d = repo.get(cmd.id)
         
@@ -636,14 +683,10 @@ def create_container() -> dict:
                     if not getattr(d, 'ephemeral', False):
                         repo.save(d)
                         # Auto-delete external tasks after completion (they're ephemeral)
-                        # Give a brief moment for TUI to show completion, then remove
-                        import threading
-                        def cleanup():
-                            import time
-                            time.sleep(1)  # Wait 1 second for TUI to render completion
-                            repo.delete(cmd.id)
-                            _rebuild_index_mapping(repo)
-                        threading.Thread(target=cleanup, daemon=True).start()
+                        # Give a brief moment (1s) for TUI to show completion, then remove
+                        with finished_lock:
+                            finished_external[cmd.id] = time.monotonic() + 1.0
+                            _schedule_sweep()
                     return
                 elif cmd.state == "FAILED": d.state = DownloadState.FAILED
                 elif cmd.state == "DOWNLOADING": d.state = DownloadState.DOWNLOADING
@@ -661,7 +704,9 @@ def create_container() -> dict:
     bus.register(ListDownloads, handle_list_downloads)
     bus.register(StartDownload, handle_start_download)
     bus.register(PauseDownload, handle_pause_download)
+    bus.register(PauseDownloads, handle_pause_downloads)
     bus.register(ResumeDownload, handle_resume_download)
+    bus.register(ResumeDownloads, handle_resume_downloads)
     bus.register(RemoveDownload, handle_remove_download)
     bus.register(RemoveBrowserDownload, handle_remove_browser_download)
     bus.register(RetryDownload, handle_retry_download)
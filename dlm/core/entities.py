@@ -3,8 +3,12 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import List, Optional, Tuple
 from datetime import datetime
+import sys
 import uuid
 
+# Slotted dataclasses need 3.10+; older interpreters keep the regular __dict__ layout
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 class DownloadState(Enum):
     QUEUED = "QUEUED"
     INITIALIZING = "INITIALIZING"
@@ -15,9 +19,9 @@ class DownloadState(Enum):
     FAILED = "FAILED"
     CANCELLED = "CANCELLED"
 
-@dataclass
+@dataclass(**_SLOTS)
 class Segment:
-    """Represents a byte range of the file."""
+    """Represents a byte range of the file (slotted: a download can hold many)."""
     start_byte: int
     end_byte: int
     downloaded_bytes: int = 0
@@ -25,6 +29,8 @@ class Segment:
     start_hash: Optional[str] = None  # Hash of first N bytes
     end_hash: Optional[str] = None    # Hash of last N bytes
     part_number: Optional[int] = None # Original part number for partial downloads
+    # Torrent piece mapping, set via set_piece_range (declared so slotted instances can hold it)
+    _piece_range: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False, compare=False)
     
     @property
     def is_complete(self) -> bool:
@@ -34,8 +40,6 @@ class Segment:
     @property
     def piece_range(self) -> Optional[Tuple[int, int]]:
         """Get piece range for torrent downloads"""
-        if not hasattr(self, '_piece_range'):
-            return None
         return self._piece_range
     
     def set_piece_range(self, start_piece: int, end_piece: int):
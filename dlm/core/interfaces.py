@@ -8,6 +8,10 @@ class NetworkAdapter(ABC):
         """Returns the content length in bytes, or None if unknown."""
         pass
 
+    def probe(self, url: str, referer: Optional[str] = None, headers: Optional[Dict] = None, cookies: Optional[Dict] = None, user_agent: Optional[str] = None, timeout: int = 15) -> Tuple[Optional[int], Optional[bool]]:
+        """Returns (content length, range support). Range support is None when the probe could not tell."""
+        return self.get_content_length(url, referer=referer, headers=headers, cookies=cookies, user_agent=user_agent), None
+
     @abstractmethod
     def supports_ranges(self, url: str, referer: Optional[str] = None, headers: Optional[Dict] = None, cookies: Optional[Dict] = None, user_agent: Optional[str] = None) -> bool:
         """Checks if the server supports byte ranges."""
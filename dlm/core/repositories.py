@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
-from .entities import Download
+from .entities import Download, DownloadState
 
 class DownloadRepository(ABC):
     @abstractmethod
@@ -15,6 +15,11 @@ class DownloadRepository(ABC):
     def get_all(self) -> List[Download]:
         pass
 
+    @abstractmethod
+    def get_ids_by_state(self, state: DownloadState) -> List[str]:
+        """IDs of downloads in the given state, oldest first."""
+        pass
+
     @abstractmethod
     def delete(self, download_id: str) -> None:
         pass
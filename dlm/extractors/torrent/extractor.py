@@ -116,7 +116,11 @@ class TorrentExtractor(BaseExtractor):
              # Try to resolve metadata via DHT if libtorrent is available
              # This is a synchronous resolve for the extractor phase
              try:
-                 ses = lt.session()
+                 # Status alerts are off by default; metadata_received_alert is one of them
+                 ses = lt.session({
+                     'alert_mask': lt.alert.category_t.status_notification |
+                                   lt.alert.category_t.error_notification
+                 })
                  ses.listen_on(6881, 6891)
                  params = {
                      'save_path': '.',
@@ -126,11 +130,16 @@ class TorrentExtractor(BaseExtractor):
                  
                  print(f"[Torrent] Resolving magnet metadata ({info_hash})...")
                  timeout = 30 # seconds
-                 start = time.time()
+                 deadline = time.monotonic() + timeout
                  while not handle.has_metadata():
-                     if time.time() - start > timeout:
+                     remaining = deadline - time.monotonic()
+                     if remaining <= 0:
                          break
-                     time.sleep(1)
+                     # Wake on the next alert instead of sleeping a full second;
+                     # capped so has_metadata() is re-checked anyway
+                     ses.wait_for_alert(int(min(remaining, 1.0) * 1000))
+                     if any(isinstance(a, lt.metadata_received_alert) for a in ses.pop_alerts()):
+                         break # Metadata landed: stop waiting right away
                  
                  if handle.has_metadata():
                      info = handle.get_torrent_info()
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from enum import Enum, auto
 from dataclasses import dataclass, field
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any
 import shutil
 import importlib.util
 import sys
@@ -81,7 +81,8 @@ class PythonImportDependency(Dependency):
         try:
             spec = importlib.util.find_spec(self.module_name)
             return spec is not None
-        except:
+        except (ImportError, ValueError):
+            # Missing parent package, or a module whose __spec__ is None
             return False
 
     def install_command(self) -> List[str]:
@@ -119,11 +120,18 @@ class Feature:
     is_core: bool = False
     category: str = "General"
     
-    def check_status(self) -> FeatureStatus:
+    def check_status(self, met: Optional[Dict[str, bool]] = None) -> FeatureStatus:
+        """
+        met: optional {dependency name: is_met()} results already probed by the caller,
+        so dependencies shared between features are not checked again.
+        """
         if not self.dependencies:
             return FeatureStatus.INSTALLED
             
-        met_count = sum(1 for d in self.dependencies if d.is_met())
+        if met is None:
+            met_count = sum(1 for d in self.dependencies if d.is_met())
+        else:
+            met_count = sum(1 for d in self.dependencies if met[d.name])
         
         if met_count == len(self.dependencies):
             return FeatureStatus.INSTALLED
@@ -5,7 +5,6 @@ from prompt_toolkit.widgets import Frame, TextArea, Label, Box
 from prompt_toolkit.layout.containers import Window, HSplit, VSplit, FloatContainer, Float, WindowAlign, ConditionalContainer
 from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.layout.dimension import Dimension as D
-from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.styles import Style
 from prompt_toolkit.filters import Condition
 
@@ -13,8 +12,19 @@ from .registry import FEATURES, get_feature
 from .models import FeatureStatus
 from .installer import FeatureInstaller
 import asyncio
-import threading
-import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Fixed bars, given as ready fragment lists so no text conversion runs on redraw
+_TITLE_TEXT = [("", " DLM MODULE MANAGER ")]
+_FOOTER_TEXT = [("", " [↑/↓] Navigate  [Space] Select  [i] Install  [u] Uninstall  [q] Quit ")]
+
+# Status column of a feature row: (style, text incl. trailing space)
+_STATUS_CELLS = {
+    FeatureStatus.INSTALLED: ("class:installed", "[INSTALLED] "),
+    FeatureStatus.PARTIAL: ("class:partial", "[ BROKEN  ] "),
+    FeatureStatus.MISSING: ("class:missing", "[ MISSING ] "),
+}
 
 class FeatureManagerTUI:
     def __init__(self):
@@ -31,9 +41,25 @@ class FeatureManagerTUI:
             self.flat_items.append(("Header", cat))
             self.flat_items.extend(feats)
             
+        # Row parts that never change, formatted once instead of on every render
+        self._header_rows = {
+            i: (("", "\n"), ("class:header", f" {item[1].upper()} \n"))
+            for i, item in enumerate(self.flat_items) if isinstance(item, tuple)
+        }
+        self._name_cells = {f.id: f"{f.name:<25}" for f in FEATURES}
+        
+        # Navigation only ever lands on feature rows: precompute their positions once
+        self._nav_indices = [i for i, item in enumerate(self.flat_items) if not isinstance(item, tuple)]
+        self._nav_pos = {idx: pos for pos, idx in enumerate(self._nav_indices)}
+        
         self.selected_index = 1 # Skip first header
+        self._info_cache = {} # selected_index -> info pane fragments
         
         self.statuses = {} 
+        self._status_version = 0 # Bumped by refresh_statuses, part of the list render key
+        self._info_dialog_cache = {} # (feature id, status version) -> info dialog lines
+        self._list_cache_key = None
+        self._list_cache = []
         self.refresh_statuses()
         
         self.bindings = KeyBindings()
@@ -43,24 +69,30 @@ class FeatureManagerTUI:
         self.show_dialog = False
         self.dialog_title = ""
         self.dialog_lines = []
+        self._dialog_src = None # dialog_lines list the cached body was joined from
+        self._dialog_len = 0
+        self._dialog_body = ""
         self.is_installing = False
         self.spinner_idx = 0
+        self._pending_lines = deque() # Progress lines from the pip worker, drained on the loop
+        self._flush_scheduled = False
         
         # -- LAYOUT --
-        self.title_control = FormattedTextControl(" DLM MODULE MANAGER ")
+        # Read-only panes: fragment lists in, no cursor to place on each redraw
+        self.title_control = FormattedTextControl(_TITLE_TEXT, show_cursor=False)
         self.title_window = Window(content=self.title_control, align=WindowAlign.CENTER, height=1, style="class:title")
         
-        self.list_control = FormattedTextControl(self._get_list_text)
+        self.list_control = FormattedTextControl(self._get_list_text, show_cursor=False)
         self.list_window = Window(content=self.list_control)
         
-        self.info_control = FormattedTextControl(self._get_info_text)
+        self.info_control = FormattedTextControl(self._get_info_text, show_cursor=False)
         self.info_window = Window(content=self.info_control, height=3, style="class:info")
         
-        self.footer_control = FormattedTextControl(" [↑/↓] Navigate  [Space] Select  [i] Install  [u] Uninstall  [q] Quit ")
+        self.footer_control = FormattedTextControl(_FOOTER_TEXT, show_cursor=False)
         self.footer_window = Window(content=self.footer_control, align=WindowAlign.CENTER, height=1, style="class:footer")
 
         # Dialog (Float)
-        self.dialog_control = FormattedTextControl(self._get_dialog_text)
+        self.dialog_control = FormattedTextControl(self._get_dialog_text, show_cursor=False)
         self.dialog_window = Frame(
             Window(content=self.dialog_control, width=D(min=30, max=60), height=D(min=8, max=20)),
             title=lambda: self.dialog_title,
@@ -96,85 +128,86 @@ class FeatureManagerTUI:
             'info': '#888888 italic'
         })
         
-        self.app = Application(layout=self.layout, key_bindings=self.bindings, style=self.style, full_screen=True, refresh_interval=0.1)
-
-        # Start background spinner task
-        # We can use the refresh_interval to update spinner index in _get_text, simpler.
+        # No refresh_interval: key presses redraw on their own, and background work
+        # (install progress, spinner) calls invalidate() only when something changed.
+        # min_redraw_interval folds bursts of invalidate() (one per pip output line) into
+        # at most ~20 redraws per second.
+        self.app = Application(layout=self.layout, key_bindings=self.bindings, style=self.style, full_screen=True, min_redraw_interval=0.05)
         
     def refresh_statuses(self):
+        # Probe each dependency once per refresh: requests/ffmpeg/uvicorn... are shared
+        # between features, and dialogs reuse these results instead of re-probing.
+        unique = {}
         for f in FEATURES:
-            self.statuses[f.id] = f.check_status()
+            for d in f.dependencies:
+                unique.setdefault(d.name, d)
+        # Probes are metadata lookups / PATH scans (I/O bound): run them side by side
+        with ThreadPoolExecutor(max_workers=min(8, len(unique) or 1)) as pool:
+            results = pool.map(lambda d: d.is_met(), unique.values())
+            met = dict(zip(unique, results))
+        self.dep_met = met
+        for f in FEATURES:
+            self.statuses[f.id] = f.check_status(met)
+        self._status_version += 1
 
     def _get_list_text(self):
+        # Redraws (spinner ticks, install output) mostly leave the list as it was:
+        # only re-format it when the selection moved or statuses were re-probed
+        key = (self.selected_index, self._status_version)
+        if key != self._list_cache_key:
+            self._list_cache = self._render_list()
+            self._list_cache_key = key
+        return self._list_cache
+
+    def _render_list(self):
         result = []
-        # Update spinner frame if installing
-        if self.is_installing:
-            self.spinner_idx = (self.spinner_idx + 1) % 4
-            
+        selected_index = self.selected_index
+        statuses = self.statuses
         for i, item in enumerate(self.flat_items):
-            is_selected = (i == self.selected_index)
-            
-            if isinstance(item, tuple) and item[0] == "Header":
-                # Header Row
-                result.append(("", "\n"))
-                result.append(("class:header", f" {item[1].upper()} \n"))
+            if isinstance(item, tuple):
+                # Header Row (pre-formatted)
+                result.extend(self._header_rows[i])
                 continue
                 
-            # Feature Row
-            f = item
-            status = self.statuses.get(f.id, FeatureStatus.MISSING)
+            # Feature Row: status cell from the lookup table, name padded once in __init__
+            style, st_text = _STATUS_CELLS.get(statuses.get(item.id), _STATUS_CELLS[FeatureStatus.MISSING])
+            name_pad = self._name_cells[item.id]
             
-            if status == FeatureStatus.INSTALLED:
-                icon = "MATCH"
-                style = "class:installed"
-                st_text = "[INSTALLED]"
-            elif status == FeatureStatus.PARTIAL:
-                icon = "WARN"
-                style = "class:partial"
-                st_text = "[ BROKEN  ]"
+            if i == selected_index:
+                result.extend((("class:selected", " > "), ("class:selected", st_text), ("class:selected", name_pad)))
             else:
-                icon = "MISS"
-                style = "class:missing"
-                st_text = "[ MISSING ]"
-                
-            prefix = " > " if is_selected else "   "
-            row_style = "class:selected" if is_selected else ""
-            
-            # Name padding
-            name_pad = f"{f.name:<25}"
-            
-            # Row content
-            # (style, text)
-            line = [
-                ("", prefix),
-                (style, st_text + " "),
-                ("", name_pad)
-            ]
-            
-            if is_selected:
-                line = [(row_style, t[1]) for t in line]
-                
-            result.extend(line)
+                result.extend((("", "   "), (style, st_text), ("", name_pad)))
             result.append(("", "\n"))
             
         return result
 
     def _get_info_text(self):
-        item = self.flat_items[self.selected_index]
-        if isinstance(item, tuple): return ""
-        desc = item.description
-        dep_count = len(item.dependencies)
-        return f"\n  {desc}\n  Dependencies: {dep_count}"
+        # Descriptions never change: build each row's fragments once and reuse them on redraw
+        fragments = self._info_cache.get(self.selected_index)
+        if fragments is None:
+            item = self.flat_items[self.selected_index]
+            if isinstance(item, tuple):
+                fragments = []
+            else:
+                fragments = [("", f"\n  {item.description}\n  Dependencies: {len(item.dependencies)}")]
+            self._info_cache[self.selected_index] = fragments
+        return fragments
 
     def _get_dialog_text(self):
         s = "|/-\\"
         spinner = s[self.spinner_idx] if self.is_installing else " "
         
-        text = "\n".join(self.dialog_lines[-7:])
+        # The spinner redraws every 0.1s: rejoin the tail only when lines were added or replaced
+        lines = self.dialog_lines
+        if lines is not self._dialog_src or len(lines) != self._dialog_len:
+            self._dialog_src = lines
+            self._dialog_len = len(lines)
+            self._dialog_body = "\n".join(lines[-7:])
+        text = self._dialog_body
         if self.is_installing:
-             return f"\n {spinner} Working...\n\n{text}"
+             return [("", f"\n {spinner} Working...\n\n{text}")]
         else:
-             return f"\n{text}\n\n (Press Space to Close)"
+             return [("", f"\n{text}\n\n (Press Space to Close)")]
 
     def _setup_bindings(self):
         @self.bindings.add('q', filter=Condition(lambda: not self.show_dialog))
@@ -198,48 +231,19 @@ class FeatureManagerTUI:
 
             if self.show_dialog: return # Ignore if busy
             
-            item = self.flat_items[self.selected_index]
-            if isinstance(item, tuple): return # Cannot click header
-            
-            feature = item
+            # Navigation never lands on a header row (see _nav_indices)
+            feature = self.flat_items[self.selected_index]
             status = self.statuses.get(feature.id)
             
-            dep_lines = self._get_dependency_lines(feature)
-
-            if status == FeatureStatus.INSTALLED:
-                # Offer Toggle/Uninstall
-                self.dialog_title = f"{feature.name}"
-                
-                base_lines = ["Status: INSTALLED"]
-                if feature.is_core:
-                     base_lines.append("(Core Feature - Cannot Uninstall)")
-                else:
-                     base_lines.append("Press 'u' to UNINSTALL.")
-                
-                base_lines.append("Press Space to close.")
-                self.dialog_lines = base_lines + dep_lines 
-                self.show_dialog = True
-            else:
-                # Show Info Dialog for Missing
-                self.dialog_title = f"{feature.name}"
-                self.dialog_lines = [
-                    "Status: MISSING",
-                    " ",
-                    f"Description: {feature.description}",
-                    " ",
-                    "Press 'i' to INSTALL this feature.",
-                    "Press Space to close."
-                ] + dep_lines
-                self.show_dialog = True
+            self.dialog_title = feature.name
+            # Copy: install progress appends to dialog_lines, the cached tuple stays intact
+            self.dialog_lines = list(self._get_info_dialog_lines(feature, status))
+            self.show_dialog = True
 
         @self.bindings.add('u')
         def _(event):
-            item = self.flat_items[self.selected_index]
-            if isinstance(item, tuple): return
-            
-            feature = item
-            
-            if self.is_installing: return 
+            if self.is_installing: return
+            feature = self.flat_items[self.selected_index]
             
             # BLOCK CORE REMOVAL
             if feature.is_core:
@@ -262,73 +266,103 @@ class FeatureManagerTUI:
         @self.bindings.add('i')
         def _(event):
             # Direct install shortcut
-            item = self.flat_items[self.selected_index]
-            if isinstance(item, tuple): return
-            
-            feature = item
-            status = self.statuses.get(feature.id)
-            
             if self.is_installing: return
+            feature = self.flat_items[self.selected_index]
+            status = self.statuses.get(feature.id)
 
             if status != FeatureStatus.INSTALLED:
                 self._start_install(feature)
 
     def _move_selection(self, delta):
-        count = len(self.flat_items)
+        count = len(self._nav_indices)
         if count == 0: return
 
-        # Calculate new index with wrapping
-        new_index = (self.selected_index + delta) % count
-        
-        # Check if header (tuple), if so, skip in same direction
-        if isinstance(self.flat_items[new_index], tuple):
-             new_index = (new_index + delta) % count
-        
-        self.selected_index = new_index
+        # Step through feature rows only (headers are never selectable), with wrapping
+        pos = (self._nav_pos[self.selected_index] + delta) % count
+        self.selected_index = self._nav_indices[pos]
+
+    def _get_info_dialog_lines(self, feature, status):
+        # Same answer until the next status refresh: rebuild only when the version moved
+        key = (feature.id, self._status_version)
+        lines = self._info_dialog_cache.get(key)
+        if lines is None:
+            lines = self._info_dialog_cache[key] = tuple(self._build_info_dialog_lines(feature, status))
+        return lines
+
+    def _build_info_dialog_lines(self, feature, status):
+        if status == FeatureStatus.INSTALLED:
+            # Offer Toggle/Uninstall
+            base_lines = ["Status: INSTALLED"]
+            if feature.is_core:
+                 base_lines.append("(Core Feature - Cannot Uninstall)")
+            else:
+                 base_lines.append("Press 'u' to UNINSTALL.")
+            
+            base_lines.append("Press Space to close.")
+        else:
+            # Show Info Dialog for Missing
+            base_lines = [
+                "Status: MISSING",
+                " ",
+                f"Description: {feature.description}",
+                " ",
+                "Press 'i' to INSTALL this feature.",
+                "Press Space to close."
+            ]
+        return base_lines + self._build_dependency_lines(feature)
 
-    def _get_dependency_lines(self, feature):
+    def _build_dependency_lines(self, feature):
         lines = [" ", "Dependencies:"]
         for dep in feature.dependencies:
-            mark = "x" if dep.is_met() else " "
+            mark = "x" if self.dep_met.get(dep.name) else " "
             name = dep.name
             if hasattr(dep, 'shared') and dep.shared:
                 name += " (Shared)"
             lines.append(f" - [{mark}] {name}")
         return lines
 
+    async def _spin_while_busy(self):
+        """Advance the dialog spinner while an install/uninstall is running."""
+        while self.is_installing:
+            self.spinner_idx = (self.spinner_idx + 1) % 4
+            self.app.invalidate()
+            await asyncio.sleep(0.1)
+
     def _start_install(self, feature):
         self.dialog_title = f"Installing {feature.name}..."
         self.dialog_lines = ["Starting installation..."]
         self.show_dialog = True
         self.is_installing = True
-        
-        t = threading.Thread(target=self._run_action_thread, args=(feature, True))
-        t.daemon = True
-        t.start()
+        self.app.create_background_task(self._spin_while_busy())
+        self.app.create_background_task(self._run_action(feature, True))
 
     def _start_uninstall(self, feature):
         self.dialog_title = f"Uninstalling {feature.name}..."
         self.dialog_lines = ["Starting removal...", "Note: Uninstalls python packages."]
         self.show_dialog = True
         self.is_installing = True
-        
-        t = threading.Thread(target=self._run_action_thread, args=(feature, False))
-        t.daemon = True
-        t.start()
+        self.app.create_background_task(self._spin_while_busy())
+        self.app.create_background_task(self._run_action(feature, False))
+
+    async def _run_action(self, feature, is_install):
+        """Run the blocking pip work in the loop's executor; UI state is only updated on the loop."""
+        loop = asyncio.get_running_loop()
 
-    def _run_action_thread(self, feature, is_install):
         def progress_cb(msg):
-            self.dialog_lines.append(msg)
-            self.app.invalidate()
-            
-        try:
-            if is_install:
-                success = FeatureInstaller.install_feature(feature, on_progress=progress_cb)
-                res_msg = "Installed"
-            else:
-                success = FeatureInstaller.uninstall_feature(feature, on_progress=progress_cb)
-                res_msg = "Uninstalled"
+            # Runs in the worker thread. pip can print hundreds of lines a second:
+            # buffer them and hop back onto the UI loop once per burst, not per line.
+            self._pending_lines.append(msg)
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                loop.call_soon_threadsafe(self._flush_dialog_lines)
+
+        if is_install:
+            action, res_msg = FeatureInstaller.install_feature, "Installed"
+        else:
+            action, res_msg = FeatureInstaller.uninstall_feature, "Uninstalled"
 
+        try:
+            success = await loop.run_in_executor(None, action, feature, progress_cb)
             if success:
                 self.dialog_lines.append(f"✅ SUCCESS! {res_msg}.")
             else:
@@ -336,10 +370,18 @@ class FeatureManagerTUI:
         except Exception as e:
             self.dialog_lines.append(f"Error: {e}")
         
-        self.refresh_statuses()
+        await loop.run_in_executor(None, self.refresh_statuses)
         self.is_installing = False
         self.app.invalidate()
 
+    def _flush_dialog_lines(self):
+        # Clear the flag before draining: a line queued after this point schedules a new flush
+        self._flush_scheduled = False
+        pending = self._pending_lines
+        while pending:
+            self.dialog_lines.append(pending.popleft())
+        self.app.invalidate()
+
 def run_feature_manager():
     tui = FeatureManagerTUI()
     tui.app.run()
@@ -1,5 +1,6 @@
 import ssl
-from typing import Iterator, Optional, Dict
+import threading
+from typing import Iterator, Optional, Dict, Tuple
 from dlm.core.interfaces import NetworkAdapter
 try:
     from curl_cffi import requests
@@ -21,6 +22,20 @@ class HttpNetworkAdapter(NetworkAdapter):
         self.ssl_context = ssl.create_default_context()
         self.ssl_context.check_hostname = False
         self.ssl_context.verify_mode = ssl.CERT_NONE
+        # One keep-alive session per worker thread (sessions are not thread-safe)
+        self._local = threading.local()
+
+    def _session(self):
+        """Session reused by every segment fetched on this thread, so connections stay open."""
+        s = getattr(self._local, "session", None)
+        if s is None:
+            session_args = {"impersonate": "chrome120"} if HAVE_CURL_CFFI else {}
+            s = requests.Session(**session_args)
+            self._local.session = s
+        else:
+            # Keep the connections, not cookies set by an earlier (possibly unrelated) download
+            s.cookies.clear()
+        return s
     
     def _add_browser_headers(self, url: str, referer: Optional[str] = None, headers: Optional[list] = None, cookies: Optional[dict] = None, user_agent: Optional[str] = None) -> tuple:
         final_headers = []
@@ -59,6 +74,11 @@ class HttpNetworkAdapter(NetworkAdapter):
         return final_headers, final_cookies
 
     def get_content_length(self, url: str, referer: Optional[str] = None, headers: Optional[dict] = None, cookies: Optional[dict] = None, user_agent: Optional[str] = None, timeout: int = 15) -> Optional[int]:
+        return self.probe(url, referer, headers, cookies, user_agent, timeout)[0]
+
+    def probe(self, url: str, referer: Optional[str] = None, headers: Optional[dict] = None, cookies: Optional[dict] = None, user_agent: Optional[str] = None, timeout: int = 15) -> Tuple[Optional[int], Optional[bool]]:
+        """Size probe that also reports range support when the stream probe answers it (206)."""
+        ranges = None
         try:
             h, c = self._add_browser_headers(url, referer, headers, cookies, user_agent)
             
@@ -81,6 +101,9 @@ class HttpNetworkAdapter(NetworkAdapter):
                     # Perform stream probe GET request
                     with s.get(url, headers=h_range, cookies=c, stream=True, timeout=(10, 30), verify=False) as r_stream:
                         resp = r_stream # Use the stream response for header extraction
+                        if resp.status_code == 206:
+                            # Same bytes=0-0 request supports_ranges would send
+                            ranges = True
                         
                         # Extract size from Content-Range or Content-Length
                         length = resp.headers.get("Content-Length")
@@ -89,16 +112,16 @@ class HttpNetworkAdapter(NetworkAdapter):
                             if '/' in cr:
                                 total = cr.split('/')[-1]
                                 if total.isdigit():
-                                    return int(total)
+                                    return int(total), ranges
                         
                         if length and str(length).isdigit():
-                            return int(length)
+                            return int(length), ranges
                         
                         # If still unknown or failed status code
                         if resp.status_code not in [200, 206]:
                             if resp.status_code in [401, 403, 410]:
                                 raise ServerError(f"HTTP {resp.status_code}")
-                            return None
+                            return None, None
 
                 # CRITICAL: Validate Content-Type for the successful HEAD request if it reached here
                 content_type = resp.headers.get("Content-Type", "").lower()
@@ -113,12 +136,12 @@ class HttpNetworkAdapter(NetworkAdapter):
                     if '/' in cr:
                         total = cr.split('/')[-1]
                         if total.isdigit():
-                            return int(total)
+                            return int(total), ranges
                 
-                return int(length) if length and str(length).isdigit() else None
+                return int(length) if length and str(length).isdigit() else None, ranges
         except Exception as e:
             if isinstance(e, (NetworkError, ServerError)): raise
-            return None
+            return None, None
 
     def supports_ranges(self, url: str, referer: Optional[str] = None, headers: Optional[list] = None, cookies: Optional[dict] = None, user_agent: Optional[str] = None) -> bool:
         try:
@@ -131,7 +154,7 @@ class HttpNetworkAdapter(NetworkAdapter):
             with requests.Session(**session_args) as s:
                 resp = s.get(url, headers=h, cookies=c, verify=False, timeout=(10, 30))
                 return resp.status_code == 206
-        except:
+        except Exception:
             return False
 
     def download_range(self, url: str, start: int, end: int, referer: Optional[str] = None, headers: Optional[list] = None, cookies: Optional[dict] = None, user_agent: Optional[str] = None) -> Iterator[bytes]:
@@ -141,10 +164,9 @@ class HttpNetworkAdapter(NetworkAdapter):
         else:
             h["Range"] = f"bytes={start}-{end}"
         
+        resp = None
         try:
-            session_args = {"impersonate": "chrome120"} if HAVE_CURL_CFFI else {}
-            s = requests.Session(**session_args)
-            resp = s.get(url, headers=h, cookies=c, stream=True, verify=False, timeout=(10, 30))
+            resp = self._session().get(url, headers=h, cookies=c, stream=True, verify=False, timeout=(10, 30))
             
             if resp.status_code not in [200, 206]:
                 if resp.status_code in [401, 403, 410]:
@@ -157,17 +179,19 @@ class HttpNetworkAdapter(NetworkAdapter):
 
             for chunk in resp.iter_content(chunk_size=64 * 1024):
                 yield chunk
-            s.close()
         except requests.exceptions.RequestException as e:
             raise NetworkError(f"Connection failed: {e}")
+        finally:
+            # Release the connection back to the session (also on pause/cancel)
+            if resp is not None:
+                resp.close()
 
     def download_stream(self, url: str, referer: Optional[str] = None, headers: Optional[list] = None, cookies: Optional[dict] = None, user_agent: Optional[str] = None) -> Iterator[bytes]:
         h, c = self._add_browser_headers(url, referer, headers, cookies, user_agent)
         
+        resp = None
         try:
-            session_args = {"impersonate": "chrome120"} if HAVE_CURL_CFFI else {}
-            s = requests.Session(**session_args)
-            resp = s.get(url, headers=h, cookies=c, stream=True, verify=False, timeout=(10, 30))
+            resp = self._session().get(url, headers=h, cookies=c, stream=True, verify=False, timeout=(10, 30))
             
             if resp.status_code != 200:
                 if resp.status_code in [401, 403, 410]:
@@ -180,6 +204,9 @@ class HttpNetworkAdapter(NetworkAdapter):
 
             for chunk in resp.iter_content(chunk_size=64 * 1024):
                 yield chunk
-            s.close()
         except requests.exceptions.RequestException as e:
             raise NetworkError(f"Connection failed: {e}")
+        finally:
+            # Release the connection back to the session (also on pause/cancel)
+            if resp is not None:
+                resp.close()
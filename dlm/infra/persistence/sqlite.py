@@ -11,6 +11,7 @@ from dlm.core.interfaces import NetworkAdapter
 class SqliteDownloadRepository(DownloadRepository):
     def __init__(self, db_path: Path):
         self.db_path = db_path.resolve()
+        self._col_pos_cache = {} # tuple(cursor columns) -> {name: position}
         self._ensure_db_exists()
 
     def _ensure_db_exists(self):
@@ -347,6 +348,16 @@ class SqliteDownloadRepository(DownloadRepository):
         finally:
             conn.close()
 
+    def get_ids_by_state(self, state: DownloadState) -> List[str]:
+        # Filtered in SQL: no row (segments JSON etc.) is deserialized just to test its state
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT id FROM downloads WHERE state = ? ORDER BY created_at ASC", (state.name,))
+            return [row[0] for row in cursor.fetchall()]
+        finally:
+            conn.close()
+
     def delete(self, download_id: str) -> None:
         conn = self._get_connection()
         try:
@@ -514,6 +525,14 @@ class SqliteDownloadRepository(DownloadRepository):
         finally:
             conn.close()
 
+    def _column_positions(self, cols) -> dict:
+        """Column name -> row position, built once per distinct result layout."""
+        key = tuple(cols)
+        pos = self._col_pos_cache.get(key)
+        if pos is None:
+            pos = self._col_pos_cache[key] = {name: i for i, name in enumerate(cols)}
+        return pos
+
     def _row_to_entity(self, row, cols=None) -> Download:
         segments_data = json.loads(row[7]) if row[7] else []
         segments = [
@@ -549,75 +568,76 @@ class SqliteDownloadRepository(DownloadRepository):
             cursor = self._get_connection().cursor()
             cursor.execute("PRAGMA table_info(downloads)")
             cols = [c[1] for c in cursor.fetchall()]
-
-        d = Download(url=row[cols.index("url")])
-        d.id = row[cols.index("id")]
-        d.target_filename = row[cols.index("target_filename")]
-        d.total_size = row[cols.index("total_size")] or 0
-        d.state = DownloadState[row[cols.index("state")]]
-        d.created_at = dt.fromisoformat(row[cols.index("created_at")])
-        d.error_message = row[cols.index("error_message")]
+        pos = self._column_positions(cols)
+
+        d = Download(url=row[pos["url"]])
+        d.id = row[pos["id"]]
+        d.target_filename = row[pos["target_filename"]]
+        d.total_size = row[pos["total_size"]] or 0
+        d.state = DownloadState[row[pos["state"]]]
+        d.created_at = dt.fromisoformat(row[pos["created_at"]])
+        d.error_message = row[pos["error_message"]]
         d.segments = segments
         
-        if "last_update" in cols: d.last_update = dt.fromisoformat(row[cols.index("last_update")]) if row[cols.index("last_update")] else dt.now()
-        if "speed_bps" in cols: d.speed_bps = row[cols.index("speed_bps")] or 0.0
-        if "resumable" in cols: d.resumable = bool(row[cols.index("resumable")])
-        if "resume_state" in cols:
-            val = row[cols.index("resume_state")]
+        if "last_update" in pos: d.last_update = dt.fromisoformat(row[pos["last_update"]]) if row[pos["last_update"]] else dt.now()
+        if "speed_bps" in pos: d.speed_bps = row[pos["speed_bps"]] or 0.0
+        if "resumable" in pos: d.resumable = bool(row[pos["resumable"]])
+        if "resume_state" in pos:
+            val = row[pos["resume_state"]]
             d.resume_state = ResumeState[val] if val else ResumeState.STABLE
-        if "max_connections" in cols: d.max_connections = row[cols.index("max_connections")] or 4
-        if "integrity_state" in cols:
-            val = row[cols.index("integrity_state")]
+        if "max_connections" in pos: d.max_connections = row[pos["max_connections"]] or 4
+        if "integrity_state" in pos:
+            val = row[pos["integrity_state"]]
             d.integrity_state = IntegrityState[val] if val else IntegrityState.PENDING
-        if "partial" in cols: d.partial = bool(row[cols.index("partial")])
-        if "task_id" in cols: d.task_id = row[cols.index("task_id")]
-        if "assigned_parts_summary" in cols: d.assigned_parts_summary = row[cols.index("assigned_parts_summary")]
-        if "source" in cols: d.source = row[cols.index("source")]
-        if "media_type" in cols: d.media_type = row[cols.index("media_type")]
-        if "cut_range" in cols: d.cut_range = row[cols.index("cut_range")]
-        if "conversion_required" in cols: d.conversion_required = bool(row[cols.index("conversion_required")])
-        if "duration" in cols: d.duration = row[cols.index("duration")]
-        if "audio_mode" in cols: d.audio_mode = row[cols.index("audio_mode")]
-        if "vocals_gpu" in cols: d.vocals_gpu = bool(row[cols.index("vocals_gpu")])
-        if "quality" in cols: d.quality = row[cols.index("quality")]
-        if "output_path" in cols: d.output_path = row[cols.index("output_path")]
+        if "partial" in pos: d.partial = bool(row[pos["partial"]])
+        if "task_id" in pos: d.task_id = row[pos["task_id"]]
+        if "assigned_parts_summary" in pos: d.assigned_parts_summary = row[pos["assigned_parts_summary"]]
+        if "source" in pos: d.source = row[pos["source"]]
+        if "media_type" in pos: d.media_type = row[pos["media_type"]]
+        if "cut_range" in pos: d.cut_range = row[pos["cut_range"]]
+        if "conversion_required" in pos: d.conversion_required = bool(row[pos["conversion_required"]])
+        if "duration" in pos: d.duration = row[pos["duration"]]
+        if "audio_mode" in pos: d.audio_mode = row[pos["audio_mode"]]
+        if "vocals_gpu" in pos: d.vocals_gpu = bool(row[pos["vocals_gpu"]])
+        if "quality" in pos: d.quality = row[pos["quality"]]
+        if "output_path" in pos: d.output_path = row[pos["output_path"]]
         
-        if "captured_headers_json" in cols:
-            val = row[cols.index("captured_headers_json")]
+        if "captured_headers_json" in pos:
+            val = row[pos["captured_headers_json"]]
             d.captured_headers = json.loads(val) if val else {}
-        if "captured_cookies_json" in cols:
-            val = row[cols.index("captured_cookies_json")]
+        if "captured_cookies_json" in pos:
+            val = row[pos["captured_cookies_json"]]
             d.captured_cookies = json.loads(val) if val else {}
         
-        if "source_url" in cols:
-            d.source_url = row[cols.index("source_url")]
+        if "source_url" in pos:
+            d.source_url = row[pos["source_url"]]
         
-        if "browser_capture_id" in cols:
-            d.browser_capture_id = row[cols.index("browser_capture_id")]
+        if "browser_capture_id" in pos:
+            d.browser_capture_id = row[pos["browser_capture_id"]]
         
-        if "user_agent" in cols:
-            d.user_agent = row[cols.index("user_agent")]
+        if "user_agent" in pos:
+            d.user_agent = row[pos["user_agent"]]
 
-        if "probed_via_stream" in cols:
-            d.probed_via_stream = bool(row[cols.index("probed_via_stream")])
+        if "probed_via_stream" in pos:
+            d.probed_via_stream = bool(row[pos["probed_via_stream"]])
 
-        if "browser_probe_done" in cols:
-            d.browser_probe_done = bool(row[cols.index("browser_probe_done")])
+        if "browser_probe_done" in pos:
+            d.browser_probe_done = bool(row[pos["browser_probe_done"]])
         
-        if "torrent_files_json" in cols:
-            val = row[cols.index("torrent_files_json")]
+        if "torrent_files_json" in pos:
+            val = row[pos["torrent_files_json"]]
             d.torrent_files = json.loads(val) if val else []
 
-        if "folder_id" in cols:
-            d.folder_id = row[cols.index("folder_id")]
+        if "folder_id" in pos:
+            d.folder_id = row[pos["folder_id"]]
         
-        if "torrent_file_offset" in cols:
-            d.torrent_file_offset = row[cols.index("torrent_file_offset")] or 0
+        if "torrent_file_offset" in pos:
+            d.torrent_file_offset = row[pos["torrent_file_offset"]] or 0
 
-        if "manual_progress" in cols:
-            d._manual_progress = row[cols.index("manual_progress")]
+        if "manual_progress" in pos:
+            d._manual_progress = row[pos["manual_progress"]]
         
-        if "downloaded_bytes_override" in cols:
-            d._downloaded_bytes_override = row[cols.index("downloaded_bytes_override")]
+        if "downloaded_bytes_override" in pos:
+            d._downloaded_bytes_override = row[pos["downloaded_bytes_override"]]
 
         return d
@@ -1,16 +1,39 @@
 import cmd
 from typing import Optional, List, Dict, Set, Tuple, Any
+import json
+import re
 import shlex
+import shutil
 import sys
 import os
 import threading
 import time
 from pathlib import Path
-from dlm.app.commands import CommandBus, AddDownload, ListDownloads, StartDownload, PauseDownload, ResumeDownload, RemoveDownload, RetryDownload, SplitDownload, ImportDownload, VocalsCommand, BrowserCommand
+from dlm.app.commands import CommandBus, AddDownload, ListDownloads, StartDownload, PauseDownload, PauseDownloads, ResumeDownload, ResumeDownloads, RemoveDownload, RetryDownload, SplitDownload, ImportDownload, VocalsCommand, BrowserCommand
+from dlm.app.commands import CreateFolder, DeleteFolder, MoveTask, RemoveBrowserDownload, PromoteBrowserDownload
 from dlm.core.workspace import WorkspaceManager
-from dlm.bootstrap import get_project_root
+from dlm.bootstrap import get_project_root, get_uuid_by_index
 from dlm.interface.tui import TUI
 
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+# Vocals monitor bars, one per 5% step
+QUEUE_BARS = tuple("#" * i + "." * (20 - i) for i in range(21))
+# Vocals monitor: progress-only changes repaint at most ~15 times per second
+MONITOR_FRAME_INTERVAL = 1 / 15
+MONITOR_SETTLE = 0.05 # Pause after a wake so a burst of queue changes paints once
+# Vocals monitor row template (filename, status, bar), shared with its header
+QUEUE_ROW_FMT = "{:<30} {:<15} {}"
+QUEUE_HEADER = QUEUE_ROW_FMT.format('Filename', 'Status', 'Progress')
+
+# `ls` columns: fixed header and per-row lookups, built once at import
+LS_ROW_FMT = "{:<4} {:<3} {:<5} {:<26} {:<10} {}"
+LS_HEADER = LS_ROW_FMT.format('STAT', '#', 'TAGS', 'Filename', 'Size', 'Progress')
+LS_STATE_SYMBOLS = {
+    'DOWNLOADING': '[↓]', 'PAUSED': '[||]', 'QUEUED': '[>]',
+    'COMPLETED': '[✓]', 'FAILED': '[✗]', 'WAITING': '[…]', 'INITIALIZING': '[…]'
+}
+LS_SOURCE_TAGS = {'youtube': "YT", 'tiktok': "TT", 'browser': "BRW"}
+
 def parse_index_selector(selector: str, get_uuid_by_index, max_index: int) -> list:
     """
     Parse an index selector expression into a sorted list of (index, uuid) tuples.
@@ -163,7 +186,6 @@ def is_mobile_env() -> bool:
 
 def check_binary_exists(name: str) -> bool:
     """Check if a system binary exists in PATH."""
-    import shutil
     return shutil.which(name) is not None
 
 def try_folder_picker():
@@ -230,7 +252,6 @@ def try_file_picker(title="Select file", filetypes=None):
 
 def clear_lines(n: int):
     """Clear the last n lines from terminal using ANSI escape codes."""
-    import sys
     if n <= 0: return
     # Move cursor up n lines
     sys.stdout.write(f'\033[{n}A')
@@ -240,11 +261,9 @@ def clear_lines(n: int):
 
 def clear_section_after_delay(lines: int, delay: float = 0.3):
     """Clear a section of output after a short delay."""
-    import time
     time.sleep(delay)
     # Just clear lines upwards (standard delete), not whole screen wipe
     # We use explicit line deletion loop here for sections to avoid nuking everything below
-    import sys
     for _ in range(lines):
         sys.stdout.write('\033[F\033[K')
     sys.stdout.flush()
@@ -318,21 +337,18 @@ class DLMShell(cmd.Cmd):
         # But we must ensure specific ID or just name?
         # Name "__workspace__" at root level.
         # Name "__workspace__" at root level.
-        from dlm.core.workspace import WorkspaceManager
         ws_name = WorkspaceManager.WORKSPACE_DIR_NAME
         existing = self.service.repository.get_folder_by_name(ws_name, None)
         if not existing:
              # Create it directly via repo or bus
              # Using bus to ensure proper flow? No, internal init.
              # But CreateFolder command might be safer.
-             from dlm.app.commands import CreateFolder
              try:
                  self.bus.handle(CreateFolder(name=ws_name, parent_id=None))
              except Exception:
                  pass
 
     def _get_workspace_folder_id(self) -> Optional[int]:
-        from dlm.core.workspace import WorkspaceManager
         ws_name = WorkspaceManager.WORKSPACE_DIR_NAME
         folder = self.service.repository.get_folder_by_name(ws_name, None)
         return folder['id'] if folder else None
@@ -442,7 +458,6 @@ class DLMShell(cmd.Cmd):
         except KeyboardInterrupt:
             print("\nBye!")
             # Use sys.exit to ensure we break out of any parent loops in main.py
-            import sys
             sys.exit(0)
 
     def do_retry(self, arg):
@@ -499,14 +514,11 @@ class DLMShell(cmd.Cmd):
 
     def _format_size(self, size_bytes: int) -> str:
         """Format bytes to human readable string."""
-        if not size_bytes: return "0 B"
-        import math
-        if size_bytes == 0: return "0 B"
-        size_name = ("B", "KB", "MB", "GB", "TB")
-        i = int(math.floor(math.log(size_bytes, 1024)))
-        p = math.pow(1024, i)
-        s = round(size_bytes / p, 2)
-        return f"{s} {size_name[i]}"
+        if not size_bytes or size_bytes <= 0: return "0 B"
+        # Unit index straight from the bit length (every 10 bits is one 1024 step), no log/pow
+        i = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(SIZE_UNITS) - 1)
+        s = round(size_bytes / (1 << (10 * i)), 2)
+        return f"{s} {SIZE_UNITS[i]}"
 
     def _calculate_folder_size(self, folder_id: Optional[int], recursive: bool = False, brw: bool = False) -> Tuple[int, int]:
         """
@@ -701,7 +713,6 @@ class DLMShell(cmd.Cmd):
         Open the DLM Share interface for local network file sharing.
         Usage: share [--room ROOM_NAME] [--add-file PATH] [--add-folder PATH]
         """
-        import shlex
         args = shlex.split(arg) if arg else []
         
         # Parse arguments
@@ -727,16 +738,18 @@ class DLMShell(cmd.Cmd):
             from dlm.share.cli import main as share_main
             share_main(room_name=room_name, add_file=add_file, add_folder=add_folder)
         except Exception as e:
-            print(f"Error launching share: {e}")
             import traceback
-            traceback.print_exc()
+            # One write for message + traceback: the Textual app may have just torn the
+            # terminal down, and separate stdout/stderr writes interleave there
+            sys.stdout.flush()
+            sys.stderr.write(f"Error launching share: {e}\n{traceback.format_exc()}")
+            sys.stderr.flush()
             
 
 
     def _get_uuid_by_index(self, index_arg):
         try:
             idx = int(index_arg)
-            from dlm.bootstrap import get_uuid_by_index
             return get_uuid_by_index(idx)
         except Exception:
             raise ValueError("Invalid index")
@@ -744,11 +757,9 @@ class DLMShell(cmd.Cmd):
     def _parse_selector(self, arg: str, brw: bool = False) -> list:
         """Parse index selector and return list of (index, uuid) tuples."""
         # Refresh indexing from database based on current folder
-        from dlm.app.commands import ListDownloads
         self.bus.handle(ListDownloads(brw=brw, folder_id=self.current_folder_id, include_workspace=self.show_workspace))
         
         max_idx = self._get_max_index(brw=brw)
-        from dlm.bootstrap import get_uuid_by_index
         return parse_index_selector(arg, lambda idx: get_uuid_by_index(idx, brw=brw), max_idx)
 
     def _get_max_index(self, brw: bool = False) -> int:
@@ -1157,19 +1168,10 @@ class DLMShell(cmd.Cmd):
                 
                 print(f"\n[TORRENT DISCOVERY]")
                 print(f"Name: {metadata.title}")
-                import math
-                def format_size(size):
-                    if size == 0: return "0 B"
-                    size_name = ("B", "KB", "MB", "GB", "TB")
-                    i = int(math.floor(math.log(size, 1024)))
-                    p = math.pow(1024, i)
-                    s = round(size/p, 2)
-                    return "%s %s" % (s, size_name[i])
-                
-                print(f"Total Size: {format_size(metadata.total_size)}")
+                print(f"Total Size: {self._format_size(metadata.total_size)}")
                 print("\nFiles:")
                 for file in metadata.files:
-                    print(f"  [{file.index}] {file.name} ({format_size(file.size)})")
+                    print(f"  [{file.index}] {file.name} ({self._format_size(file.size)})")
                 
                 # 1. File Selection
                 print("\nSelect files:")
@@ -1201,9 +1203,10 @@ class DLMShell(cmd.Cmd):
                 # 3. Task Creation
                 if creation_mode == 'single':
                     # One task for the whole selected set
-                    filenames = [f.name for f in metadata.files if f.index in selected_indices]
+                    selected_set = set(selected_indices) # O(1) membership for large torrents
+                    filenames = [f.name for f in metadata.files if f.index in selected_set]
                     display_name = metadata.title if len(selected_indices) > 1 else filenames[0]
-                    total_size = sum(f.size for f in metadata.files if f.index in selected_indices)
+                    total_size = sum(f.size for f in metadata.files if f.index in selected_set)
                     self.bus.handle(AddDownload(
                         url=url,
                         source='torrent',
@@ -1218,9 +1221,10 @@ class DLMShell(cmd.Cmd):
                         folder_id=self.current_folder_id
                     ))
                 else:
-                    # One task per file
+                    # One task per file; index -> file built once instead of a scan per selection
+                    files_by_index = {f.index: f for f in metadata.files}
                     for idx in selected_indices:
-                        file = next(f for f in metadata.files if f.index == idx)
+                        file = files_by_index[idx]
                         self.bus.handle(AddDownload(
                             url=url,
                             source='torrent',
@@ -1356,11 +1360,12 @@ class DLMShell(cmd.Cmd):
                 
                 # --- Processing ---
                 count = 0
+                selected_set = set(selected_indices) # O(1) membership per playlist entry
                 for i, entry in enumerate(entries):
                     idx = i + 1
                     
                     # Skip unselected items
-                    if idx not in selected_indices:
+                    if idx not in selected_set:
                         continue
                         
                     item_url = entry.get('url')
@@ -1526,8 +1531,6 @@ class DLMShell(cmd.Cmd):
         brw_mode = "--brw" in arg
         clean_arg = arg.replace("--brw", "").strip()
         
-        from dlm.app.commands import StartDownload, ListDownloads, PauseDownload, ResumeDownload
-        
         try:
             # 1. Check if selector is '*'
             if clean_arg == '*':
@@ -1594,13 +1597,8 @@ class DLMShell(cmd.Cmd):
             # Collect IDs first
             ids_to_pause = [uuid for idx, uuid in selected]
             
-            count = 0
-            for uuid in ids_to_pause:
-                try:
-                    self.bus.handle(PauseDownload(id=uuid))
-                    count += 1
-                except Exception:
-                    pass
+            # One command: every transfer is signalled before any state is persisted
+            count = self.bus.handle(PauseDownloads(ids=ids_to_pause))
             
             print(f"Paused {count} download(s).")
         except Exception as e:
@@ -1623,13 +1621,8 @@ class DLMShell(cmd.Cmd):
             # Collect IDs first
             ids_to_resume = [uuid for idx, uuid in selected]
             
-            count = 0
-            for uuid in ids_to_resume:
-                try:
-                    self.bus.handle(ResumeDownload(id=uuid))
-                    count += 1
-                except Exception:
-                    pass
+            # One command: every task is queued before the engine runs once
+            count = self.bus.handle(ResumeDownloads(ids=ids_to_resume))
             
             print(f"Resumed {count} download(s).")
         except Exception as e:
@@ -1652,7 +1645,6 @@ class DLMShell(cmd.Cmd):
                 print(f"Error: Folder '{name}' already exists.")
                 return
             
-            from dlm.app.commands import CreateFolder
             self.bus.handle(CreateFolder(name=name, parent_id=self.current_folder_id))
             print(f"Folder '{name}' created.\n")
             self.do_ls("")
@@ -1746,7 +1738,6 @@ class DLMShell(cmd.Cmd):
                         print(f"Error: Folder '{clean_arg}' not found.")
                         return
 
-            from dlm.app.commands import ListDownloads
             items = self.bus.handle(ListDownloads(brw=brw_mode, folder_id=target_folder_id, include_workspace=self.show_workspace))
             
             if not items:
@@ -1758,8 +1749,8 @@ class DLMShell(cmd.Cmd):
                  items = [i for i in items if i.get('filename') != WorkspaceManager.WORKSPACE_DIR_NAME]
             # ------------------------
 
-            print(f"{'STAT':<4} {'#':<3} {'TAGS':<5} {'Filename':<26} {'Size':<10} {'Progress'}")
-            print("-" * 75)
+            # Collect the listing and write it in one go instead of one print per row
+            lines = [LS_HEADER, "-" * 75]
             
             for d in items:
                 if d.get('is_folder'):
@@ -1767,24 +1758,16 @@ class DLMShell(cmd.Cmd):
                     filename = truncate_middle(f"/{d['filename']}", 26)
                     tag_str = ""
                 else:
-                    state_map = {
-                        'DOWNLOADING': '[↓]', 'PAUSED': '[||]', 'QUEUED': '[>]', 
-                        'COMPLETED': '[✓]', 'FAILED': '[✗]', 'WAITING': '[…]', 'INITIALIZING': '[…]'
-                    }
-                    symbol = state_map.get(d['state'], '[ ]')
+                    symbol = LS_STATE_SYMBOLS.get(d['state'], '[ ]')
                     filename = truncate_middle(d['filename'], 26)
-                    
-                    tags = []
-                    if d.get('source') == 'youtube': tags.append("YT")
-                    elif d.get('source') == 'tiktok': tags.append("TT")
-                    elif d.get('source') == 'browser': tags.append("BRW")
-                    tag_str = " ".join(tags)
+                    tag_str = LS_SOURCE_TAGS.get(d.get('source'), "")
 
                 size_val = d.get('total') or d.get('size') or 0
                 size_str = self._format_size(size_val) if size_val > 0 else "-"
                 progress_str = d['progress']
 
-                print(f"{symbol:<4} {d['index']:<3} {tag_str:<5} {filename:<26} {size_str:<10} {progress_str}")
+                lines.append(LS_ROW_FMT.format(symbol, d['index'], tag_str, filename, size_str, progress_str))
+            print("\n".join(lines))
         except Exception as e:
             print(f"Error: {e}")
 
@@ -1862,7 +1845,6 @@ class DLMShell(cmd.Cmd):
                 return
 
             # 3. Handle Move
-            from dlm.app.commands import MoveTask
             count = 0
             for idx, uuid_str in selected:
                 is_source_folder = uuid_str.startswith("folder:")
@@ -1933,7 +1915,6 @@ class DLMShell(cmd.Cmd):
                 print("Clipboard is empty. Use 'copy' (cp) first.")
                 return
             
-            from dlm.app.commands import MoveTask
             count = 0
             target_folder_id = self.current_folder_id
             
@@ -1981,8 +1962,6 @@ class DLMShell(cmd.Cmd):
                     pass  # Continue to normal rm logic
                 else:
                     # Inside a workspace folder - check depth
-                    from dlm.core.workspace import WorkspaceManager
-                    from pathlib import Path
                     
                     # Parse current path to check depth
                     # current_path_str is like "/__workspace__/cod-wwii.iso" or "/__workspace__/cod-wwii.iso/segments"
@@ -1999,7 +1978,6 @@ class DLMShell(cmd.Cmd):
                                 task_folder = wm.workspace_root / workspace_name
                                 
                                 if task_folder.exists():
-                                    import shutil
                                     shutil.rmtree(task_folder)
                                     print(f"✅ Workspace '{workspace_name}' deleted.")
                                     # Navigate back to parent
@@ -2032,7 +2010,6 @@ class DLMShell(cmd.Cmd):
                         confirm = input(f"Are you sure you want to delete folder #{idx} and all its contents? [y/N]: ").lower()
                         if confirm != 'y': continue
                     
-                    from dlm.app.commands import DeleteFolder
                     try:
                         self.bus.handle(DeleteFolder(folder_id=int(uuid_str.replace("folder:", "")), force=force))
                         print(f"Folder #{idx} removed.")
@@ -2040,7 +2017,6 @@ class DLMShell(cmd.Cmd):
                         print(f"Error removing folder #{idx}: {e}")
                 else:
                     if brw_mode:
-                        from dlm.app.commands import RemoveBrowserDownload
                         # uuid_str here is actually the stringified ID from `ls --brw` mapping
                         # bootstrap.py: `_browser_index_to_id = {i: item['id'] ...}`
                         # so uuid_str is likely "123" (the DB ID)
@@ -2050,7 +2026,6 @@ class DLMShell(cmd.Cmd):
                         except ValueError:
                              print(f"Error: Invalid browser ID {uuid_str}")
                     else:
-                        from dlm.app.commands import RemoveDownload
                         self.bus.handle(RemoveDownload(id=uuid_str))
                         print(f"Task #{idx} removed.")
             self.do_ls("--brw" if brw_mode else "") # Refresh same view
@@ -2061,7 +2036,6 @@ class DLMShell(cmd.Cmd):
         """Split download into parts: split <id> --parts <N> --users <u1> <u2> ... [--assign <u1_parts> <u2_parts> ...]
         
         Example: split 1 --parts 8 --users Alice Bob --assign 1..3,5 4,6..8"""
-        import re
         
         if not arg:
             print("Error: Arguments required.")
@@ -2080,7 +2054,6 @@ class DLMShell(cmd.Cmd):
         
         try:
             idx = int(parts_arg[0])
-            from dlm.bootstrap import get_uuid_by_index
             download_id = get_uuid_by_index(idx)
             
             # --- GUARD: Block Torrent Splitting ---
@@ -2308,7 +2281,6 @@ class DLMShell(cmd.Cmd):
     def do_import(self, arg):
         """Import downloads from a workspace manifest: import <path_to_manifest.json> [--sep] [--target <path>]"""
         try:
-            from pathlib import Path
             wm = WorkspaceManager(get_project_root())
         except Exception as e:
             print(f"Error: {e}")
@@ -2334,7 +2306,6 @@ class DLMShell(cmd.Cmd):
             if idx < len(args):
                 folder_name = args.pop(idx)
                 # Create folder in base destination
-                from dlm.app.commands import CreateFolder
                 try:
                     target_id = self.bus.handle(CreateFolder(name=folder_name, parent_id=base_target_id))
                     print(f"Created folder: {folder_name}")
@@ -2351,7 +2322,6 @@ class DLMShell(cmd.Cmd):
             selector = " ".join(args)
             
             # Fetch browser captures to get total count
-            from dlm.app.commands import ListDownloads, PromoteBrowserDownload
             items = self.bus.handle(ListDownloads(brw=True))
             if not items:
                 print("No browser captures found.")
@@ -2379,7 +2349,6 @@ class DLMShell(cmd.Cmd):
             return
 
         # Existing manifest import logic
-        from pathlib import Path
         
         path_str = None
         filter_parts = None
@@ -2458,7 +2427,6 @@ class DLMShell(cmd.Cmd):
         try:
             with open(manifest_path, 'r', encoding='utf-8') as f:
                 content = f.read()
-            import json
             json.loads(content)
             is_json = True
         except:
@@ -2492,7 +2460,6 @@ class DLMShell(cmd.Cmd):
         # Legacy manifest import logic
         if filter_parts is None:
             try:
-                import json
                 with open(manifest_path, 'r', encoding='utf-8') as f:
                     manifest = json.load(f)
                 
@@ -2550,7 +2517,6 @@ class DLMShell(cmd.Cmd):
 
     def _process_dsl_tasks(self, tasks: List[Dict[str, Any]]):
         """Evaluate and queue tasks from DSL evaluation."""
-        from dlm.app.commands import AddDownload, ListDownloads
         
         for task in tasks:
             url = task['url']
@@ -2594,7 +2560,6 @@ class DLMShell(cmd.Cmd):
 
     def _process_dsl_playlist(self, res, global_config, overrides):
         """Handle playlist import with smart missing info resolution."""
-        from dlm.app.commands import AddDownload
         entries = res.entries
         total = len(entries)
         print(f"Processing playlist: {res.metadata.title} ({total} items)")
@@ -2706,8 +2671,6 @@ class DLMShell(cmd.Cmd):
              print("       export --final <path> (to move specific destination)")
              return
              
-        from dlm.core.workspace import WorkspaceManager
-        from dlm.bootstrap import get_project_root
         wm = WorkspaceManager(get_project_root())
         
         # We are likely inside /__workspace__/task or /__workspace__/task/segments
@@ -2736,7 +2699,6 @@ class DLMShell(cmd.Cmd):
         filename = "output.bin"
         if manifest_path.exists():
              try:
-                 import json
                  with open(manifest_path, 'r', encoding='utf-8') as f:
                      m = json.load(f)
                      filename = m.get('filename', 'output.bin')
@@ -2750,7 +2712,6 @@ class DLMShell(cmd.Cmd):
         # Determine Target
         if destination == "exported":
             # If --final but no destination, default to downloads
-            from dlm.bootstrap import get_project_root
             target_dir = get_project_root() / "downloads"
             target_dir.mkdir(exist_ok=True)
             target_file = target_dir / filename
@@ -2762,7 +2723,6 @@ class DLMShell(cmd.Cmd):
             target_file = target_dir / filename
         
         try:
-             import shutil
              print(f"Finalizing task '{task_folder_name}'...")
              shutil.move(str(data_part), str(target_file))
              print(f"✅ Exported to: {target_file}")
@@ -2830,12 +2790,15 @@ class DLMShell(cmd.Cmd):
             # Batch process folder
             print(f"Scanning folder: {target_path}")
             valid_exts = ['.mp3', '.wav', '.flac', '.m4a', '.mp4', '.mkv', '.avi', '.mov']
-            for f in target_path.iterdir():
-                if f.is_file() and f.suffix.lower() in valid_exts:
+            # scandir reuses the entry type from the directory listing (no stat per file)
+            with os.scandir(target_path) as it:
+                for entry in it:
+                    if not entry.is_file() or os.path.splitext(entry.name)[1].lower() not in valid_exts:
+                        continue
                     # Skip existing outputs
-                    if "_vocals" in f.name or "_no_music" in f.name or "_clean" in f.name:
+                    if "_vocals" in entry.name or "_no_music" in entry.name or "_clean" in entry.name:
                         continue
-                    targets.append(f)
+                    targets.append(Path(entry.path))
             
             if not targets:
                 print("No valid media files found in folder.")
@@ -2853,47 +2816,63 @@ class DLMShell(cmd.Cmd):
 
     def _monitor_vocals(self):
         """Live monitor for vocals queue (Persistent)."""
-        import time
-        import sys
         
         print("\n[Vocals Monitor] (Ctrl+C to exit check, process continues)")
         time.sleep(1) # Brief pause
         
         print("\033[2J", end="") # Clear once on start
+        row_cache = {} # task id -> (inputs, rendered row)
+        last_frame = None # Timeout wake-ups with no change skip the terminal write
+        last_paint = 0.0
+        last_shape = None # (queue length, active count) of the last painted frame
+        vocals_changed = self.service.vocals_changed
         try:
             while True:
-                # Use ANSI Home \033[H instead of Clear \033[2J to prevent flicker
-                sys.stdout.write("\033[H")
-                
                 queue = self.service.get_vocals_queue()
-                # Fix Active Count: Include anything not done/failed
-                pending = [t for t in queue if t['status'] not in ['done', 'failed']]
+                # Active = anything not done/failed, counted by the service as statuses change
+                active = self.service.vocals_active
+                
+                # Tasks added or finishing repaint right away; progress ticks wait for the
+                # frame budget so a fast demucs stream can't swamp the terminal
+                shape = (len(queue), active)
+                wait = last_paint + MONITOR_FRAME_INTERVAL - time.monotonic()
+                if shape == last_shape and wait > 0:
+                    time.sleep(wait)
+                    continue
+                last_shape = shape
                 
-                print("=" * 60)
-                print(f" VOCALS QUEUE MONITOR ({len(pending)} Active)")
-                print("=" * 60)
+                # Assemble the whole frame, then write it once (or not at all if nothing changed)
+                # Use ANSI Home \033[H instead of Clear \033[2J to prevent flicker
+                lines = ["\033[H" + "=" * 60, f" VOCALS QUEUE MONITOR ({active} Active)", "=" * 60]
                 
                 if not queue:
-                    print("\n  [Waiting for tasks...]")
-                    print("  (Run 'vocals <file>' in another terminal to add tasks)")
+                    lines.append("\n  [Waiting for tasks...]")
+                    lines.append("  (Run 'vocals <file>' in another terminal to add tasks)")
                 
                 else:
-                    print(f"{'Filename':<30} {'Status':<15} {'Progress'}")
-                    print("-" * 60)
+                    lines.append(QUEUE_HEADER)
+                    lines.append("-" * 60)
                     
                     # Show last 10 tasks to avoid overflow, or scroll?
                     # Let's show all pending + last 5 done/failed
-                    display_list = list(queue)
+                    display_list = queue
                     if len(display_list) > 15:
                         # Keep all pending, prune old done
                         done = [t for t in display_list if t['status'] not in ['queued', 'processing']]
-                        active = [t for t in display_list if t['status'] in ['queued', 'processing']]
-                        display_list = active + done[-5:]
+                        running = [t for t in display_list if t['status'] in ['queued', 'processing']]
+                        display_list = running + done[-5:]
                     
                     for task in display_list:
+                         progress = task.get('progress', 0)
+                         key = (task['filename'], task['status'], progress, task.get('error'))
+                         cached = row_cache.get(task['id'])
+                         if cached and cached[0] == key:
+                             # Finished/queued rows (most of the list) never change between frames
+                             lines.append(cached[1])
+                             continue
+                         
                          name = truncate_middle(task['filename'], 28)
                          status = truncate_middle(task['status'], 15)
-                         progress = task.get('progress', 0)
                          
                          bar = ""
                          if task['status'] in ['queued']:
@@ -2904,18 +2883,28 @@ class DLMShell(cmd.Cmd):
                              bar = f"[Failed] {truncate_middle(str(task.get('error','')), 15)}"
                          else:
                              # Processing (any other state like 'extracting audio...', 'processing')
-                             filled = int(progress // 5)
-                             bar = f"[{'#' * filled}{'.' * (20-filled)}] {progress}%"
+                             bar = f"[{QUEUE_BARS[min(int(progress // 5), 20)]}] {progress}%"
                              
-                         print(f"{name:<30} {status:<15} {bar}")
+                         row = QUEUE_ROW_FMT.format(name, status, bar)
+                         row_cache[task['id']] = (key, row)
+                         lines.append(row)
 
-                print("-" * 60)
-                print("(Ctrl+C to Exit Monitor Mode)")
+                lines.append("-" * 60)
+                lines.append("(Ctrl+C to Exit Monitor Mode)")
                 # Clear rest of screen to handle shrinking output
-                sys.stdout.write("\033[J")
-                sys.stdout.flush()
-                
-                time.sleep(1)
+                frame = "\n".join(lines) + "\n\033[J"
+                if frame != last_frame:
+                    sys.stdout.write(frame)
+                    sys.stdout.flush()
+                    last_frame = frame
+                    last_paint = time.monotonic()
+                
+                # Woken by the service on any queue/task change; timeout is only a liveness fallback
+                if vocals_changed.wait(5.0):
+                    # Let a burst (several tasks queued, progress ticks) land before redrawing;
+                    # tasks added/finished skip the frame budget above but not this settle
+                    time.sleep(MONITOR_SETTLE)
+                vocals_changed.clear()
                 
         except KeyboardInterrupt:
             # Show full errors for failed tasks on exit
@@ -3075,7 +3064,6 @@ class DLMShell(cmd.Cmd):
             print("Reason: Playwright requires a desktop browser engine which is not available natively in this environment.")
             return
 
-        from dlm.app.commands import BrowserCommand
         self.bus.handle(BrowserCommand())
 
     def do_verify(self, arg):
@@ -2,19 +2,61 @@ import sys
 import time
 import shutil
 import os
+from functools import lru_cache
 from dlm.app.commands import CommandBus, ListDownloads
 
+# Static monitor chrome, built once instead of on every frame
+_MONITOR_HEADER = "\033[1;36m[ DLM MONITOR ]\033[0m | Press Ctrl+C to return to shell\n"
+_MONITOR_SEPARATOR = "─" * 60 # Sliced to the terminal width when narrower
+
+# Colors (RGB 24-bit)
+CLR_COMPLETED = "\033[38;2;114;156;31m" # Lime #729C1F
+CLR_DOWNLOADING = "\033[38;2;249;38;114m" # Pink #F92672
+CLR_WAITING = "\033[38;2;0;170;255m"    # Blue/Cyan
+CLR_TRACK = "\033[38;2;24;24;24m" # Track #181818
+CLR_RESET = "\033[0m"
+
+_STATE_COLORS = {"COMPLETED": CLR_COMPLETED, "WAITING": CLR_WAITING} # Anything else: downloading pink
+_ACTIVE_STATES = frozenset(("DOWNLOADING", "INITIALIZING"))
+
+def _format_size(v):
+    if v >= 1024**3: return f"{v/1024**3:.1f}G"
+    if v >= 1024**2: return f"{v/1024**2:.1f}M"
+    if v >= 1024: return f"{v/1024:.0f}K"
+    return f"{v} B"
+
+# Speed suffix by 1024-power: nothing below 1 KB/s, then KB/s and MB/s
+_SPEED_FORMATS = ("", " | {:.0f}KB/s", " | {:.1f}MB/s")
+
+def _format_speed(speed: float) -> str:
+    if speed <= 1024:
+        return ""
+    i = min((int(speed).bit_length() - 1) // 10, len(_SPEED_FORMATS) - 1)
+    return _SPEED_FORMATS[i].format(speed / (1 << (10 * i)))
+
+@lru_cache(maxsize=1024)
+def _render_bar(color: str, filled: int, tip: str, track: int) -> str:
+    """
+    Colored progress bar for one (color, filled cells, tip, track) combination.
+    Progress moves a cell every 1-2% at typical widths, so most frames hit the cache.
+    """
+    # Built in one pass: each color code is emitted once per run, not per cell
+    return f"{color}{'━' * filled}{tip}{CLR_TRACK}{'━' * track}{CLR_RESET}"
+
 class TUI:
     def __init__(self, bus: CommandBus):
         self.bus = bus
         self._persistence_cache = {} # {uuid: (last_record, timestamp)}
         self._prev_active_ids = set()
+        self._line_cache = {} # {uuid: (row inputs, formatted line)} for rows on the last frame
+        self._last_frame = None # Exact bytes written last; an identical frame is not rewritten
 
     def monitor(self):
         """Live monitor loop with stable, flicker-free rendering."""
         # Initial clear to start fresh
         sys.stdout.write("\033[2J\033[H")
         sys.stdout.flush()
+        self._last_frame = None
         
         try:
             while True:
@@ -78,6 +120,7 @@ class TUI:
         # Initial clear
         sys.stdout.write("\033[2J\033[H")
         sys.stdout.flush()
+        self._last_frame = None
         
         try:
             while True:
@@ -126,67 +169,77 @@ class TUI:
             return True 
 
     def _render_active_tasks(self, downloads, max_name_len, custom_header: list = None):
-        term_width = shutil.get_terminal_size((80, 20)).columns
+        term_width, term_height = shutil.get_terminal_size((80, 20))
         
+        separator = _MONITOR_SEPARATOR[:term_width] + "\033[K\n"
         if custom_header:
-             output = ["\033[H"] + [f"{line}\033[K\n" for line in custom_header] + ["─" * min(term_width, 60) + "\033[K\n"]
+             output = ["\033[H"] + [f"{line}\033[K\n" for line in custom_header] + [separator]
         else:
-             output = ["\033[H", "\033[1;36m[ DLM MONITOR ]\033[0m | Press Ctrl+C to return to shell\n", "─" * min(term_width, 60) + "\033[K\n"]
+             output = ["\033[H", _MONITOR_HEADER, separator]
 
         if not downloads:
             output.append("\nNo active downloads.\033[K\n")
         else:
-            for d in downloads:
-                line = self._format_download_line(d, term_width, max_name_len)
+            # Only format rows that fit on screen; rows past the bottom would just scroll away
+            room = max(1, term_height - (len(output) - 1) - 1)
+            visible = downloads if len(downloads) <= room else downloads[:room - 1]
+            # Reuse rows whose inputs did not move since the last frame (paused, waiting,
+            # just-finished, stalled); only rows on this frame are kept for the next one
+            prev_cache, line_cache = self._line_cache, {}
+            for d in visible:
+                get = d.get
+                key = (get('state'), get('filename'), get('progress'), get('downloaded'), get('total'),
+                       get('speed'), get('index'), term_width, max_name_len)
+                cached = prev_cache.get(get('id'))
+                if cached and cached[0] == key:
+                    line = cached[1]
+                else:
+                    line = self._format_download_line(d, term_width, max_name_len)
+                line_cache[get('id')] = (key, line)
                 output.append(f"{line}\033[K\n") # Clear to end of line to prevent ghosting
+            self._line_cache = line_cache
+            hidden = len(downloads) - len(visible)
+            if hidden:
+                output.append(f"  … ({hidden} more)\033[K\n")
         
         # Clear everything below the current output block
         output.append("\033[J")
-        sys.stdout.write("".join(output))
+        frame = "".join(output)
+        if frame == self._last_frame:
+            return # Nothing moved (idle/paused): skip the terminal write entirely
+        self._last_frame = frame
+        sys.stdout.write(frame)
         sys.stdout.flush()
 
     def _format_download_line(self, d: dict, term_width: int, max_name_len: int) -> str:
-        # Colors (RGB 24-bit)
-        CLR_COMPLETED = "\033[38;2;114;156;31m" # Lime #729C1F
-        CLR_DOWNLOADING = "\033[38;2;249;38;114m" # Pink #F92672
-        CLR_WAITING = "\033[38;2;0;170;255m"    # Blue/Cyan
-        CLR_TRACK = "\033[38;2;24;24;24m" # Track #181818
-        CLR_RESET = "\033[0m"
-        
-        state = d.get('state')
-        if state == 'COMPLETED': main_color = CLR_COMPLETED
-        elif state == 'WAITING': main_color = CLR_WAITING
-        else: main_color = CLR_DOWNLOADING
-        
-        filename = d.get('filename', 'Unknown')
-        progress_str = d.get('progress', '0.0%')
-        downloaded = d.get('downloaded', 0)
-        total = d.get('total', 0)
-        speed = d.get('speed', 0.0)
-        
-        def format_size(v):
-            if v >= 1024**3: return f"{v/1024**3:.1f}G"
-            if v >= 1024**2: return f"{v/1024**2:.1f}M"
-            if v >= 1024: return f"{v/1024:.0f}K"
-            return f"{v} B"
+        # Snapshot every field once; the rest of the row works on locals
+        get = d.get
+        state = get('state')
+        filename = get('filename', 'Unknown')
+        progress_str = get('progress', '0.0%')
+        downloaded = get('downloaded', 0)
+        total = get('total', 0)
+        speed = get('speed', 0.0)
+        index = get('index', '?')
+        
+        main_color = _STATE_COLORS.get(state, CLR_DOWNLOADING)
         
         # Stats Block
-        is_active = state in ['DOWNLOADING', 'INITIALIZING']
+        is_active = state in _ACTIVE_STATES
         if total > 0:
-            size_part = f"{format_size(downloaded)}/{format_size(total)}"
+            size_part = f"{_format_size(downloaded)}/{_format_size(total)}"
         else:
             # For torrents or streams where size is discovered during download
-            size_part = f"{format_size(downloaded)}" if downloaded > 0 else "0 B"
-        speed_part = f" | {speed/1024**2:.1f}MB/s" if speed > 1024**2 else (f" | {speed/1024:.0f}KB/s" if speed > 1024 else "")
+            size_part = f"{_format_size(downloaded)}" if downloaded > 0 else "0 B"
         
         if state == 'COMPLETED': status_text = "Completed"
         elif state == 'WAITING': status_text = "» waiting"
         else: status_text = progress_str
         
-        stats_part = f"{status_text:>11} | {size_part}{speed_part if is_active else ''}"
+        stats_part = f"{status_text:>11} | {size_part}{_format_speed(speed) if is_active else ''}"
         
         # Title Block
-        prefix = f"[#{d.get('index', '?')}] "
+        prefix = f"[#{index}] "
         # Format: [#X]Filename | ━━━━━━━━ | Status | Size
         # Reserve space for: prefix(len) + separator(3) + stats(len) + separator(3) + 2(bar edges)
         # We need to allocate remaining space between Name and Bar.
@@ -211,18 +264,13 @@ class TUI:
         bar_width = max(5, bar_width)
         
         try: pct = float(progress_str.replace('%',''))
-        except: pct = 0.0
+        except (ValueError, AttributeError): pct = 0.0 # "N/A" or a non-string value
         filled = int(pct/100 * bar_width) if (total > 0 or state == 'COMPLETED' or pct > 0) else 0
         
-        bar_parts = []
-        for i in range(bar_width):
-            if i < filled:
-                bar_parts.append(f"{main_color}━")
-            elif i == filled and pct < 100 and is_active:
-                bar_parts.append(f"{main_color}╸") # Pointy tip in same color
-            else:
-                bar_parts.append(f"{CLR_TRACK}━")
-        bar_render = "".join(bar_parts) + CLR_RESET
+        filled = min(filled, bar_width)
+        tip = "╸" if (filled < bar_width and pct < 100 and is_active) else "" # Pointy tip in same color
+        track = bar_width - filled - len(tip)
+        bar_render = _render_bar(main_color, filled, tip, track)
         
         # Line styling (Standard colors for text)
         return f"{prefix}{title_block} | {bar_render} | {stats_part}"
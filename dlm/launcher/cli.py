@@ -9,12 +9,17 @@ from .installer import FeatureInstaller
 
 def handle_launcher_command():
     """Main entry point for 'dlm launcher'."""
+    tui = None
     while True:
         print("\033[2J\033[H", end="") # Clear screen
         print("DLM Feature Manager")
         print("-------------------\n")
         
-        tui = LauncherTUI(FEATURES)
+        if tui is None:
+            # Probes install state of every feature; only redone after an install ran
+            tui = LauncherTUI(FEATURES)
+        else:
+            tui.selected_ids = set(tui.installed_ids) # Fresh checklist, same probe results
         selected_ids = tui.run()
         
         if not selected_ids:
@@ -25,7 +30,7 @@ def handle_launcher_command():
         to_install = []
         for f_id in selected_ids:
             feature = get_feature(f_id)
-            if feature and not feature.is_installed():
+            if feature and f_id not in tui.installed_ids:
                 to_install.append(feature)
         
         # 2. Install if needed
@@ -39,6 +44,7 @@ def handle_launcher_command():
                 print("Installation aborted.")
                 continue
             else:
+                tui = None # Install state changes below
                 for f in to_install:
                     print(f"\nInstalling {f.name}...")
                     success = FeatureInstaller.install_feature(f.id, registry=sys.modules[__name__], on_progress=print)
@@ -3,6 +3,7 @@
 import os
 import shutil
 import subprocess
+import time
 try:
     import curses
 except ImportError:
@@ -16,7 +17,16 @@ class LauncherTUI:
     
     def __init__(self, features):
         self.features = features
-        self.selected_ids: Set[str] = {f.id for f in features if f.is_installed()}
+        # is_installed() hits package metadata for every dependency; installs only happen
+        # after this checklist returns (and a new LauncherTUI is built), so resolve it once.
+        self.installed_ids: Set[str] = {f.id for f in features if f.is_installed()}
+        self.selected_ids: Set[str] = set(self.installed_ids)
+        # Curses rows formatted once instead of on every key press: only the check mark
+        # depends on selection, so keep both variants (index = selected?)
+        self._row_lines = {}
+        for f in features:
+            label = f"{f.name:<20} " + ("(installed)" if f.id in self.installed_ids else f"({f.estimated_size})")
+            self._row_lines[f.id] = ("[ ] " + label, "[*] " + label)
 
     def run(self) -> List[str]:
         """Run the best available checklist UI. Returns list of selected feature IDs."""
@@ -49,7 +59,7 @@ class LauncherTUI:
         for f in self.features:
             status = "ON" if f.id in self.selected_ids else "OFF"
             label = f"{f.name} ({f.estimated_size})"
-            if f.is_installed():
+            if f.id in self.installed_ids:
                 label = f"{f.name} (installed)"
             args.extend([f.id, label, status])
 
@@ -77,7 +87,9 @@ class LauncherTUI:
         current_row = 0
         
         while True:
-            stdscr.clear()
+            # erase() only blanks the buffer; clear() would force curses to repaint the
+            # whole terminal on every key press instead of sending the changed cells
+            stdscr.erase()
             h, w = stdscr.getmaxyx()
             
             stdscr.addstr(1, 2, "DLM Feature Manager", curses.A_BOLD | curses.A_UNDERLINE)
@@ -88,16 +100,14 @@ class LauncherTUI:
                 y = 4 + i
                 if y >= h - 1: break 
                 
-                check = "[*]" if f.id in self.selected_ids else "[ ]"
-                status = "(installed)" if f.is_installed() else f"({f.estimated_size})"
-                line = f"{check} {f.name:<20} {status}"
+                line = self._row_lines[f.id][f.id in self.selected_ids]
                 
                 if i == current_row:
                     stdscr.attron(curses.A_REVERSE)
-                    stdscr.addstr(y, x, f"> {line}")
+                    stdscr.addstr(y, x, "> " + line)
                     stdscr.attroff(curses.A_REVERSE)
                 else:
-                    stdscr.addstr(y, x, f"  {line}")
+                    stdscr.addstr(y, x, "  " + line)
 
             stdscr.refresh()
             
@@ -130,7 +140,7 @@ class LauncherTUI:
             
             for i, f in enumerate(self.features):
                 mark = "[x]" if f.id in self.selected_ids else "[ ]"
-                status = "(installed)" if f.is_installed() else ""
+                status = "(installed)" if f.id in self.installed_ids else ""
                 print(f" {i+1}. {mark} {f.name} {status}")
             
             print("\nCommands: [Number] to toggle, [d]one to confirm, [q]uit")
@@ -147,7 +157,7 @@ class LauncherTUI:
                     f_id = self.features[idx].id
                     if f_id == 'downloader':
                         print("Core module cannot be disabled.")
-                        import time; time.sleep(1) 
+                        time.sleep(1)
                     else:
                         if f_id in self.selected_ids:
                             self.selected_ids.remove(f_id)
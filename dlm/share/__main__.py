@@ -1,5 +1,5 @@
-from .app import DlmShareApp
+from .cli import main
 
 if __name__ == "__main__":
-    app = DlmShareApp()
-    app.run()
+    # Same entry as "dlm share": installs uvloop when available before running the app
+    main()
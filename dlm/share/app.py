@@ -2,8 +2,10 @@ from textual.app import App
 from .screens.home_screen import HomeScreen
 from .screens.room_screen import RoomScreen
 from .screens.join_screen import JoinScreen
+from .screens.sub_screens import QueueScreen, TransferScreen
 from .networking import NetworkManager
 import asyncio
+import os
 
 class DlmShareApp(App):
     """The main application class for dlm share."""
@@ -23,12 +25,18 @@ class DlmShareApp(App):
         "join": JoinScreen
     }
 
+    # Static sub-screens: installed once and reused by name instead of rebuilt per visit
+    SCREENS = {
+        "queue": QueueScreen,
+        "transfers": TransferScreen,
+    }
+
     def __init__(self):
         super().__init__()
         self.net = NetworkManager(username=self._get_username())
+        self._scan_task = None # Pending beacon-listener bind on the app loop
 
     def _get_username(self):
-        import os
         return os.environ.get("USERNAME", "User")
 
     def on_mount(self) -> None:
@@ -52,7 +60,16 @@ class DlmShareApp(App):
     def start_scanning(self, callback):
         """Start UDP listener."""
         self.net.on_room_found = callback
-        asyncio.create_task(self.net.start_client_scan())
+        if self._scan_task is None or self._scan_task.done():
+            # Keep a reference: the loop only holds tasks weakly
+            self._scan_task = asyncio.create_task(self.net.start_client_scan())
+
+    def stop_scanning(self):
+        """Stop UDP listener (leaving the join screen)."""
+        if self._scan_task is not None and not self._scan_task.done():
+            self._scan_task.cancel() # Still binding: drop it instead of closing afterwards
+        self._scan_task = None
+        self.net.stop_client_scan()
 
     async def join_room(self, ip, port):
         """Connect to a room."""
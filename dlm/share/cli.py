@@ -1,5 +1,16 @@
+import sys
 from .app import DlmShareApp
 
+def _install_uvloop():
+    """Run the share event loop on uvloop when it is available (not on Windows)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import uvloop
+    except ImportError:
+        return # Optional speedup; stock asyncio loop works fine
+    uvloop.install()
+
 def main(room_name="default", add_file=None, add_folder=None):
     """
     Main entry point for the dlm share TUI.
@@ -11,6 +22,7 @@ def main(room_name="default", add_file=None, add_folder=None):
     """
     # Note: We are ignoring the args for Phase 1 as per instructions (Static TUI only),
     # but we accept them to match the signature expected by repl.py
+    _install_uvloop()
     app = DlmShareApp()
     app.run()
 
@@ -1,21 +1,83 @@
 import asyncio
+import atexit
 import socket
 import json
 import logging
+import queue
 import random
+import struct
+import threading
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
 from typing import Callable, Dict, List, Optional
 
-# Basic logging setup
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger("dlm.share.net")
+# Stored inside the dlm package folder (dlm.db lives one level up, at the project root)
+LOG_FILE = Path(__file__).resolve().parent.parent / "dlm_share.log"
+
+_share_logger = logging.getLogger("dlm.share") # Parent of every share logger
+logger = _share_logger.getChild("net")
+
+_logging_lock = threading.Lock()
+_logging_configured = False
+
+def _setup_logging():
+    """
+    Send share logs to a file through a queue.
+    Handlers only enqueue records; a listener thread does the (buffered) disk writes,
+    so the event loop never blocks on log I/O and the TUI is not painted over by stderr.
+    Safe to call repeatedly: handlers are installed once per process.
+    Best effort: if the log file can't be opened (read-only install), logs are dropped.
+    """
+    global _logging_configured
+    with _logging_lock:
+        if _logging_configured:
+            return
+
+        _share_logger.setLevel(logging.INFO)
+        _share_logger.propagate = False # Never onto stderr under the TUI
+        try:
+            file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+        except OSError:
+            _share_logger.addHandler(logging.NullHandler())
+        else:
+            file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, file_handler)
+            listener.start()
+            atexit.register(listener.stop) # Flush remaining records on exit
+            _share_logger.addHandler(QueueHandler(log_queue))
+        _logging_configured = True
+
+def _encode(msg: Dict) -> bytes:
+    """Serialize a protocol message to UTF-8 JSON bytes (orjson when installed)."""
+    if HAVE_ORJSON:
+        return orjson.dumps(msg)
+    return json.dumps(msg).encode()
+
+# Both accept the raw bytes read from the socket, no decode step needed
+_decode = orjson.loads if HAVE_ORJSON else json.loads
 
 class NetworkManager:
     DISCOVERY_PORT = 9999
+    MAX_CLIENTS = 32 # Hard cap on concurrent peers per hosted room
+    BROADCAST_DELAY = 0.1 # Seconds to coalesce join/leave bursts into one broadcast
+    CONNECT_TIMEOUT = 3.0 # Seconds before giving up on a room that stopped answering
+    HELLO_TIMEOUT = 5.0 # Seconds a new connection gets to introduce itself before it is dropped
     
     def __init__(self, username: str = "User"):
+        _setup_logging()
         self.username = username
         self.is_host = False
-        self.host_ip = self._get_local_ip()
+        self._host_ip: Optional[str] = None
         self.server = None
         self.reader = None
         self.writer = None
@@ -23,7 +85,10 @@ class NetworkManager:
         # State
         self.room_name = None
         self.tcp_port = None
+        self.room_address: Optional[str] = None # "ip:port" of the hosted room, set once per room
         self.connected_devices: List[Dict] = []
+        self._clients: Dict[asyncio.StreamWriter, Dict] = {} # Host: writer -> device
+        self._connections: set = set() # Host: every accepted writer, with or without a hello
         
         # Callbacks (UI updates)
         self.on_device_list_update: Optional[Callable[[List[Dict]], None]] = None
@@ -31,18 +96,57 @@ class NetworkManager:
         
         # Tasks
         self._tasks = []
+        self._broadcast_handle: Optional[asyncio.TimerHandle] = None
+        self._scan_transport: Optional[asyncio.DatagramTransport] = None
+
+    @property
+    def host_ip(self) -> str:
+        """LAN IP of this machine, probed on first use and reused for the session."""
+        if self._host_ip:
+            return self._host_ip
+        ip = self._get_local_ip()
+        if ip != "127.0.0.1":
+            # Only remember a real LAN address; retry the probe if we fell back
+            self._host_ip = ip
+        return ip
 
     def _get_local_ip(self):
-        try:
-            # Trick to get the actual local IP connected to the network
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
+        # 1. Linux: read the default route straight from the kernel tables
+        ip = self._default_route_ip_linux()
+        if ip:
             return ip
+        try:
+            # 2. Trick to get the actual local IP connected to the network
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.connect(("8.8.8.8", 80))
+                return s.getsockname()[0]
         except Exception:
             return "127.0.0.1"
 
+    @staticmethod
+    def _default_route_ip_linux() -> Optional[str]:
+        """IPv4 of the default-route interface via /proc/net/route + SIOCGIFADDR (no routing probe)."""
+        if fcntl is None:
+            return None
+        try:
+            with open("/proc/net/route") as f:
+                next(f) # Header
+                for line in f:
+                    fields = line.split()
+                    # Iface Destination Gateway Flags ... (RTF_UP = 0x1)
+                    if fields[1] == "00000000" and int(fields[3], 16) & 0x1:
+                        iface = fields[0]
+                        break
+                else:
+                    return None
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                # SIOCGIFADDR = 0x8915; ifreq name is limited to 15 bytes
+                packed = fcntl.ioctl(s.fileno(), 0x8915, struct.pack("256s", iface[:15].encode()))
+            return socket.inet_ntoa(packed[20:24])
+        except (OSError, StopIteration, IndexError, ValueError):
+            # Missing/restricted /proc (e.g. Android), or interface without IPv4
+            return None
+
     def _find_free_port(self, start=9000, end=9100):
         for port in range(start, end):
             try:
@@ -67,6 +171,7 @@ class NetworkManager:
         )
         # Retrieve the actual assigned port
         self.tcp_port = self.server.sockets[0].getsockname()[1]
+        self.room_address = f"{self.host_ip}:{self.tcp_port}"
         
         # Add self to device list
         self.connected_devices = [{"name": f"{self.username} (Host)", "ip": self.host_ip, "status": "idle"}]
@@ -83,12 +188,12 @@ class NetworkManager:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
         
-        message = json.dumps({
+        message = _encode({
             "op": "beacon",
             "room": self.room_name,
             "port": self.tcp_port,
             "host": self.username
-        }).encode()
+        })
         
         while self.is_host:
             try:
@@ -99,22 +204,38 @@ class NetworkManager:
 
     async def start_client_scan(self):
         """Listen for UDP beacons."""
+        if self._scan_transport is not None:
+            return self._scan_transport # Already listening; callback is read per datagram
         loop = asyncio.get_running_loop()
         transport, protocol = await loop.create_datagram_endpoint(
-            lambda: DiscoveryProtocol(self.on_room_found),
+            lambda: DiscoveryProtocol(self),
             local_addr=('0.0.0.0', self.DISCOVERY_PORT)
         )
-        # Store transport to close later if needed
+        if self.on_room_found is None or self._scan_transport is not None:
+            # Scan was stopped (or restarted) while binding
+            transport.close()
+            return self._scan_transport
+        self._scan_transport = transport
         return transport
 
+    def stop_client_scan(self):
+        """Close the beacon listener so no datagrams are processed once nobody is scanning."""
+        self.on_room_found = None
+        if self._scan_transport is not None:
+            self._scan_transport.close()
+            self._scan_transport = None
+
     async def connect_to_room(self, ip: str, port: int):
         """Connect to a host."""
         try:
-            self.reader, self.writer = await asyncio.open_connection(ip, port)
+            # Bounded: a stale beacon (host gone, port filtered) fails fast instead of hanging the join
+            self.reader, self.writer = await asyncio.wait_for(
+                asyncio.open_connection(ip, port), self.CONNECT_TIMEOUT
+            )
             
             # Send HELLO
             hello = {"op": "hello", "name": self.username}
-            self.writer.write(json.dumps(hello).encode() + b'\n')
+            self.writer.write(_encode(hello) + b'\n')
             await self.writer.drain()
             
             # Start listener loop
@@ -129,33 +250,61 @@ class NetworkManager:
         addr = writer.get_extra_info('peername')
         client_name = "Unknown"
         
+        # Open sockets count against the cap, not just peers that already said hello
+        if len(self._connections) >= self.MAX_CLIENTS:
+            # Room is full: tell the peer why instead of silently dropping it
+            writer.write(_encode({"op": "error", "reason": "room full"}) + b'\n')
+            writer.close()
+            return
+        self._connections.add(writer)
+        
         try:
             while True:
-                data = await reader.readline()
+                if writer in self._clients:
+                    data = await reader.readline()
+                else:
+                    # A silent connection can't hold a slot forever
+                    data = await asyncio.wait_for(reader.readline(), self.HELLO_TIMEOUT)
                 if not data: break
                 
-                msg = json.loads(data.decode())
+                msg = _decode(data)
                 
                 if msg['op'] == 'hello':
                     client_name = msg['name']
                     # Add to list
-                    self.connected_devices.append({"name": client_name, "ip": addr[0], "status": "idle", "_w": writer})
-                    self._broadcast_peers() 
+                    device = {"name": client_name, "ip": addr[0], "status": "idle"}
+                    self._clients[writer] = device
+                    self.connected_devices.append(device)
+                    self._schedule_broadcast_peers()
                 
         except Exception:
             pass
         finally:
-            # Remove client
-            self.connected_devices = [d for d in self.connected_devices if d.get("_w") != writer]
-            self._broadcast_peers()
+            # Remove client (O(1) lookup by writer)
+            self._connections.discard(writer)
+            device = self._clients.pop(writer, None)
+            if device is not None:
+                self.connected_devices.remove(device)
+                self._schedule_broadcast_peers()
             writer.close()
 
+    def _schedule_broadcast_peers(self):
+        """Host: Coalesce bursts of membership changes into a single broadcast."""
+        if self._broadcast_handle is not None:
+            return # Already scheduled, the pending flush will see the latest list
+        loop = asyncio.get_running_loop()
+        self._broadcast_handle = loop.call_later(self.BROADCAST_DELAY, self._flush_broadcast_peers)
+
+    def _flush_broadcast_peers(self):
+        self._broadcast_handle = None
+        self._broadcast_peers()
+
     def _broadcast_peers(self):
         """Host: Send updated list to all clients."""
-        # Clean list for sending (remove writer objects)
-        clean_list = [{k:v for k,v in d.items() if k != '_w'} for d in self.connected_devices]
+        # Device dicts carry no writer objects, so they can be sent as-is
+        clean_list = self.connected_devices
         
-        msg = json.dumps({"op": "peers", "data": clean_list}).encode() + b'\n'
+        msg = _encode({"op": "peers", "data": clean_list}) + b'\n'
         
         # Update Host UI
         if self.on_device_list_update:
@@ -166,14 +315,12 @@ class NetworkManager:
                 pass
             
         # Send to clients
-        for d in self.connected_devices:
-            w = d.get("_w")
-            if w:
-                try:
-                    w.write(msg)
-                    # Don't await drain here to prevent blocking if one client is slow
-                except:
-                    pass
+        for w in self._clients:
+            try:
+                w.write(msg)
+                # Don't await drain here to prevent blocking if one client is slow
+            except Exception:
+                pass # Peer is going away; its handler removes it
 
     async def _client_listener(self):
         """Client: Listen for updates from Server."""
@@ -182,9 +329,12 @@ class NetworkManager:
                 data = await self.reader.readline()
                 if not data: break
                 
-                msg = json.loads(data.decode())
+                msg = _decode(data)
                 if msg['op'] == 'peers':
-                    self.connected_devices = msg['data']
+                    devices = msg['data']
+                    if devices == self.connected_devices:
+                        continue # Host re-sent the same roster: keep the current list, no UI update
+                    self.connected_devices = devices
                     if self.on_device_list_update:
                         try:
                             self.on_device_list_update(self.connected_devices)
@@ -198,11 +348,18 @@ class NetworkManager:
     async def shutdown(self):
         self.is_host = False
         self.on_device_list_update = None # Stop UI updates immediately
-        self.on_room_found = None
+        self.stop_client_scan()
         
         self.room_name = None
         self.tcp_port = None
+        self.room_address = None
         self.connected_devices = []
+        self._clients = {}
+        self._connections = set()
+        
+        if self._broadcast_handle:
+            self._broadcast_handle.cancel()
+            self._broadcast_handle = None
         
         for t in self._tasks: t.cancel()
         self._tasks = []
@@ -221,18 +378,27 @@ class NetworkManager:
             self.reader = None
 
 class DiscoveryProtocol(asyncio.DatagramProtocol):
-    def __init__(self, callback):
-        self.callback = callback
+    def __init__(self, manager: NetworkManager):
+        # Read the callback from the manager on each datagram, so clearing it
+        # there stops deliveries to a screen that is gone
+        self.manager = manager
 
     def connection_made(self, transport):
         self.transport = transport
 
     def datagram_received(self, data, addr):
+        callback = self.manager.on_room_found
+        if not callback:
+            return # Nobody is scanning: skip decoding entirely
         try:
-            msg = json.loads(data.decode())
-            if msg.get('op') == 'beacon' and self.callback:
-                # Add IP from addr
-                msg['ip'] = addr[0]
-                self.callback(msg)
-        except:
-            pass
+            msg = _decode(data)
+        except ValueError:
+            return # Not JSON (json/orjson decode errors are ValueErrors): some other app on the port
+        if not isinstance(msg, dict) or msg.get('op') != 'beacon':
+            return
+        # Add IP from addr
+        msg['ip'] = addr[0]
+        try:
+            callback(msg)
+        except Exception:
+            logger.exception("Room callback failed")
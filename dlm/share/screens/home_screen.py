@@ -50,7 +50,8 @@ class HomeScreen(Screen):
     }
     """
     
-    BUTTON_IDS = ["btn-create", "btn-join", "btn-exit"]
+    BUTTON_IDS = ("btn-create", "btn-join", "btn-exit") # Static focus order
+    BUTTON_INDEX = {b: i for i, b in enumerate(BUTTON_IDS)}
 
     def compose(self) -> ComposeResult:
         yield Label("DLM SHARE", id="title")
@@ -71,13 +72,14 @@ class HomeScreen(Screen):
             event.stop()
 
     def cycle_focus(self, direction: int) -> None:
-        focused = self.query("Button:focus").first()
+        # Resolve by id directly: no CSS selector parsing on every key press
+        focused = self.focused
         if not focused: return
         current_id = focused.id
-        if current_id not in self.BUTTON_IDS: return
-        idx = self.BUTTON_IDS.index(current_id)
+        idx = self.BUTTON_INDEX.get(current_id)
+        if idx is None: return
         new_idx = (idx + direction) % len(self.BUTTON_IDS)
-        self.query_one(f"#{self.BUTTON_IDS[new_idx]}").focus()
+        self.get_widget_by_id(self.BUTTON_IDS[new_idx]).focus()
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "btn-create":
@@ -3,6 +3,7 @@ from textual.screen import Screen
 from textual.widgets import Label, Button, ListView, ListItem
 from textual.containers import Vertical
 from textual.reactive import reactive
+import time
 
 class JoinScreen(Screen):
     """
@@ -41,6 +42,8 @@ class JoinScreen(Screen):
     }
     """
 
+    ROOM_TTL = 6.0 # Seconds without a beacon (three announce intervals) before a room is dropped
+
     found_rooms = reactive([]) # List of dicts: {name, ip, port, host}
 
     def compose(self) -> ComposeResult:
@@ -52,38 +55,57 @@ class JoinScreen(Screen):
         yield Label("\n[Press Escape to Cancel]", classes="dim")
 
     def on_mount(self) -> None:
-        # Start scanning via App's NetworkManager
-        self.app.start_scanning(self.on_room_found)
+        self._room_buttons = {} # (ip, port) -> Button of rooms currently listed
+        self._last_seen = {} # (ip, port) -> monotonic time of the latest beacon
+        self._room_counter = 0 # Unique widget ids, never reused after a prune
+        # Paused while suspended: no beacons arrive then, so pruning would just empty the list
+        self._prune_timer = self.set_interval(self.ROOM_TTL / 3, self.prune_rooms, pause=True)
+        # Scanning and pruning are started in on_screen_resume
 
     def on_room_found(self, room_data):
         """Callback when a room beacon is received."""
-        # Avoid duplicates
-        for r in self.found_rooms:
-            if r['ip'] == room_data['ip'] and r['port'] == room_data['port']:
-                return
+        key = (room_data['ip'], room_data['port'])
+        # Every beacon refreshes liveness; hosts re-announce every 2s
+        self._last_seen[key] = time.monotonic()
+        if key in self._room_buttons:
+            return
         
         self.found_rooms.append(room_data)
-        self.rebuild_list()
+        self.add_room_button(key, room_data)
 
-    def rebuild_list(self):
-        """Update the UI with found rooms."""
+    def add_room_button(self, key, room):
+        """Mount a button for a newly found room; rows already on screen are left untouched."""
         container = self.query_one("#room-list")
-        container.remove_children()
-        
-        if not self.found_rooms:
-            container.mount(Label("No rooms found yet...", id="placeholder"))
-            return
+        is_first = not self._room_buttons
+        if is_first:
+            # First room replaces the "No rooms found" placeholder
+            container.query("#placeholder").remove()
 
-        for idx, room in enumerate(self.found_rooms):
-            # Format: "Room Name (Host) - IP"
-            label = f"{room['room']} ({room['host']}) - {room['ip']}"
-            btn = Button(label, id=f"room-{idx}")
-            btn.room_data = room # Attach data to button
-            container.mount(btn)
+        # Format: "Room Name (Host) - IP"
+        label = f"{room['room']} ({room['host']}) - {room['ip']}"
+        btn = Button(label, id=f"room-{self._room_counter}")
+        self._room_counter += 1
+        btn.room_data = room # Attach data to button
+        self._room_buttons[key] = btn
+        container.mount(btn)
         
         # Focus first if just added
-        if len(self.found_rooms) == 1:
-            self.query("Button").first().focus()
+        if is_first:
+            self.call_after_refresh(btn.focus)
+
+    def prune_rooms(self):
+        """Drop rooms whose host stopped announcing (closed room or left the LAN)."""
+        now = time.monotonic()
+        stale = [key for key, seen in self._last_seen.items() if now - seen > self.ROOM_TTL]
+        if not stale:
+            return
+        for key in stale:
+            del self._last_seen[key]
+            self._room_buttons.pop(key).remove()
+        self.found_rooms = [r for r in self.found_rooms if (r['ip'], r['port']) in self._room_buttons]
+        
+        if not self._room_buttons:
+            self.query_one("#room-list").mount(Label("No rooms found yet...", id="placeholder", classes="dim"))
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         if getattr(event.button, "room_data", None):
@@ -97,6 +119,20 @@ class JoinScreen(Screen):
             else:
                 self.query_one("#scan-status").update("CONNECTION FAILED!")
 
+    def on_screen_resume(self) -> None:
+        # (Re)start listening whenever the room list is shown again
+        self.app.start_scanning(self.on_room_found)
+        # Rooms kept while away were not heard from, so restart their TTL with the scan
+        now = time.monotonic()
+        for key in self._last_seen:
+            self._last_seen[key] = now
+        self._prune_timer.resume()
+
+    def on_screen_suspend(self) -> None:
+        # No beacon processing while another screen is active
+        self.app.stop_scanning()
+        self._prune_timer.pause()
+
     def on_key(self, event) -> None:
         if event.key == "escape":
             self.app.switch_mode("home")
@@ -2,7 +2,7 @@ from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Static, Button, Label
 from textual.containers import Vertical
-from .sub_screens import QueueScreen, TransferScreen, QRScreen
+from .sub_screens import QRScreen
 
 class RoomScreen(Screen):
     """
@@ -57,7 +57,8 @@ class RoomScreen(Screen):
     }
     """
 
-    BUTTON_IDS = ["item-add", "item-queue", "item-trans", "item-qr", "item-leave"]
+    BUTTON_IDS = ("item-add", "item-queue", "item-trans", "item-qr", "item-leave") # Static focus order
+    BUTTON_INDEX = {b: i for i, b in enumerate(BUTTON_IDS)}
 
     def compose(self) -> ComposeResult:
         yield Static("ROOM: Loading...", id="room-header")
@@ -72,6 +73,7 @@ class RoomScreen(Screen):
 
     def on_mount(self) -> None:
         self.query_one("#item-add").focus()
+        self._dev_view = None # (names, states) currently rendered in #middle-section
         self.init_room_state()
 
     def init_room_state(self):
@@ -98,10 +100,16 @@ class RoomScreen(Screen):
 
     def update_device_list(self, devices):
         """Update the middle text area with list of devices."""
+        # Column snapshot of the rendered fields (NetworkManager always sets 'status')
+        names = [d['name'] for d in devices]
+        states = [d['status'] for d in devices]
+        view = (names, states)
+        if view == self._dev_view:
+            return # Same devices, same states: keep the current text
+        self._dev_view = view
+
         lines = ["DEVICES:"]
-        for d in devices:
-            status = d.get('status', 'idle')
-            lines.append(f"• {d['name']} ({status})") # e.g. "• User1 (idle)"
+        lines.extend(f"• {name} ({state})" for name, state in zip(names, states)) # e.g. "• User1 (idle)"
         
         lines.append("\n(Select actions below)")
         self.query_one("#middle-section").update("\n".join(lines))
@@ -115,13 +123,14 @@ class RoomScreen(Screen):
             event.stop()
 
     def cycle_focus(self, direction: int) -> None:
-        focused = self.query("Button:focus").first()
+        # Resolve by id directly: no CSS selector parsing on every key press
+        focused = self.focused
         if not focused: return
         current_id = focused.id
-        if current_id not in self.BUTTON_IDS: return
-        idx = self.BUTTON_IDS.index(current_id)
+        idx = self.BUTTON_INDEX.get(current_id)
+        if idx is None: return
         new_idx = (idx + direction) % len(self.BUTTON_IDS)
-        self.query_one(f"#{self.BUTTON_IDS[new_idx]}").focus()
+        self.get_widget_by_id(self.BUTTON_IDS[new_idx]).focus()
 
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         item_id = event.button.id
@@ -129,14 +138,15 @@ class RoomScreen(Screen):
         if item_id == "item-add":
             pass
         elif item_id == "item-queue":
-            self.app.push_screen(QueueScreen())
+            self.app.push_screen("queue")
         elif item_id == "item-trans":
-            self.app.push_screen(TransferScreen())
+            self.app.push_screen("transfers")
         elif item_id == "item-qr":
             self.app.push_screen(QRScreen())
         elif item_id == "item-leave":
             # Disconnect logic here
             await self.app.leave_room()
+            self._dev_view = None
             # Reset UI
             self.query_one("#room-header").update("ROOM: Disconnected")
             self.query_one("#middle-section").update("Disconnected.")
@@ -1,6 +1,35 @@
+from functools import lru_cache
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Label, Static
+try:
+    import qrcode
+    HAVE_QRCODE = True
+except ImportError:
+    HAVE_QRCODE = False
+
+@lru_cache(maxsize=8)
+def render_qr(data: str) -> str:
+    """
+    Render data as a text QR code (two matrix rows per line using half blocks).
+    Cached per payload, so the code is built once per room address.
+    """
+    if not HAVE_QRCODE:
+        return "[Install 'qrcode' to show a scannable code]"
+    qr = qrcode.QRCode(border=1)
+    qr.add_data(data)
+    qr.make(fit=True)
+    matrix = qr.get_matrix()
+    blank = [False] * len(matrix[0])
+    lines = []
+    for y in range(0, len(matrix), 2):
+        top = matrix[y]
+        bottom = matrix[y + 1] if y + 1 < len(matrix) else blank
+        lines.append("".join(
+            "█" if t and b else "▀" if t else "▄" if b else " "
+            for t, b in zip(top, bottom)
+        ))
+    return "\n".join(lines)
 
 class BaseSubScreen(Screen):
     """Base class for sub-screens with transparent background."""
@@ -41,9 +70,13 @@ class TransferScreen(BaseSubScreen):
 
 class QRScreen(BaseSubScreen):
     TITLE = "ROOM QR CODE"
-    CONTENT = """
-    [QR CODE PLACEHOLDER]
-    
-    IP: 192.168.1.100
-    Port: 9090
-    """
+    CONTENT = "The QR code is shown on the hosting device."
+
+    def on_mount(self) -> None:
+        net = self.app.net
+        address = net.room_address
+        if not address:
+            return # Only the host knows its listening port
+        self.query_one("#content").update(
+            f"{render_qr(address)}\n\nIP: {net.host_ip}\nPort: {net.tcp_port}"
+        )
@@ -28,6 +28,12 @@ SHARE_DEPS = [
     "psutil",
 ]
 
+# Optional speedups picked up by share when present (pure fallbacks otherwise)
+SHARE_FAST_DEPS = [
+    "uvloop; sys_platform != 'win32'", # libuv event loop
+    "orjson",                          # Faster protocol (de)serialization
+]
+
 SOCIAL_DEPS = [
     "yt-dlp",
 ]
@@ -60,6 +66,7 @@ setup(
     install_requires=CORE_DEPS,  # Only Core
     extras_require={
         "share": SHARE_DEPS,
+        "share-fast": SHARE_DEPS + SHARE_FAST_DEPS,
         "social": SOCIAL_DEPS,
         "spotify": SPOTIFY_DEPS,
         "torrent": TORRENT_DEPS,